@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import re
 
 import pymodbus
 
@@ -18,6 +20,38 @@ from .hub import create_hub
 _LOGGER = logging.getLogger(__name__)
 
 
+# Message fragments of pymodbus noise that slips past the logger settings
+PYMODBUS_NOISE_PHRASES = (
+    "transaction_id",
+    "request ask for",
+    "but got id",
+    "skipping",
+    "recv:",
+    "send:",
+    "extra data",
+)
+_PYMODBUS_NOISE_RE = re.compile(
+    "|".join(map(re.escape, PYMODBUS_NOISE_PHRASES)), re.IGNORECASE
+)
+
+
+class PyModbusFilter(logging.Filter):
+    """Filter to block pymodbus transaction ID and other noise."""
+
+    def filter(self, record) -> bool:
+        """Filter out pymodbus noise messages."""
+        if hasattr(record, "name") and "pymodbus" in record.name:
+            return False
+        message = getattr(record, "msg", "") or getattr(record, "message", "")
+        if isinstance(message, str):
+            return _PYMODBUS_NOISE_RE.search(message) is None
+        return True
+
+
+# Single instance so repeated setups don't stack filters on the root logger
+_PYMODBUS_FILTER = PyModbusFilter()
+
+
 def setup_pymodbus_logging() -> None:
     """Set up aggressive PyModbus logging suppression."""
     # Disable pymodbus logging completely
@@ -27,56 +61,35 @@ def setup_pymodbus_logging() -> None:
     logging.getLogger("pymodbus.transaction").disabled = True
     logging.getLogger("pymodbus").setLevel(logging.CRITICAL + 10)  # Above CRITICAL
 
-    # Add a filter to catch any remaining pymodbus messages
-    class PyModbusFilter(logging.Filter):
-        """Filter to block pymodbus transaction ID and other noise."""
-
-        def filter(self, record) -> bool:
-            """Filter out pymodbus noise messages."""
-            if hasattr(record, "name") and "pymodbus" in record.name:
-                return False
-            message = getattr(record, "msg", "") or getattr(record, "message", "")
-            if isinstance(message, str):
-                return not any(
-                    phrase in message.lower()
-                    for phrase in [
-                        "transaction_id",
-                        "request ask for",
-                        "but got id",
-                        "skipping",
-                        "recv:",
-                        "send:",
-                        "extra data",
-                    ]
-                )
-            return True
-
     # Apply the filter to root logger to catch everything
-    root_logger = logging.getLogger()
-    pymodbus_filter = PyModbusFilter()
-    root_logger.addFilter(pymodbus_filter)
+    logging.getLogger().addFilter(_PYMODBUS_FILTER)
 
 
 PLATFORMS = [Platform.NUMBER, Platform.SENSOR, Platform.SWITCH]
 
 
-def get_device_id_parameter(unit_id: int) -> dict[str, int]:
-    """Get the correct parameter name for device/slave ID based on pymodbus version.
-
-    This provides backwards compatibility between pymodbus 3.10 and 3.11+.
-    In 3.11+, 'slave' parameter was renamed to 'device_id'.
-    """
-
+@functools.cache
+def _device_id_parameter_name() -> str:
+    """Return the device/slave ID keyword for the installed pymodbus version."""
     try:
         version = pymodbus.__version__
         major, minor = map(int, version.split(".")[:2])
     except (AttributeError, ValueError):
         # Fallback to old parameter name if version detection fails
-        return {"slave": unit_id}
+        return "slave"
     else:
         if major > 3 or (major == 3 and minor >= 11):
-            return {"device_id": unit_id}
-        return {"slave": unit_id}
+            return "device_id"
+        return "slave"
+
+
+def get_device_id_parameter(unit_id: int) -> dict[str, int]:
+    """Get the correct parameter name for device/slave ID based on pymodbus version.
+
+    This provides backwards compatibility between pymodbus 3.10 and 3.11+.
+    In 3.11+, 'slave' parameter was renamed to 'device_id'.
+    """
+    return {_device_id_parameter_name(): unit_id}
 
 
 async def read_holding_registers_compat(client, address: int, count: int, unit_id: int):
@@ -138,9 +151,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         coordinator = hass.data[DOMAIN][entry.entry_id]
 
-        # Stop pilot service if running
-        if hasattr(coordinator.hub, "pilot"):
-            await coordinator.hub.pilot.async_stop()
+        # Stop pilot service if running so its listeners don't survive a reload
+        pilot = getattr(coordinator, "pilot", None)
+        if pilot is not None:
+            await pilot.async_stop()
 
         # Disconnect the hub
         await coordinator.hub.disconnect()
@@ -1,5 +1,6 @@
 """Config flow for SAX Battery integration."""
 
+import functools
 from typing import Any
 import uuid
 
@@ -26,6 +27,75 @@ from .const import (
     DOMAIN,
 )
 
+# Static step schemas are built once at import instead of on every form render
+USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_BATTERY_COUNT, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=3)
+        ),
+    }
+)
+
+CONTROL_OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PILOT_FROM_HA, default=False): bool,
+        vol.Required(CONF_LIMIT_POWER, default=False): bool,
+    }
+)
+
+PILOT_OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_MIN_SOC, default=DEFAULT_MIN_SOC): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
+        ),
+        vol.Required(
+            CONF_AUTO_PILOT_INTERVAL, default=DEFAULT_AUTO_PILOT_INTERVAL
+        ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
+        vol.Required(CONF_ENABLE_SOLAR_CHARGING, default=True): bool,
+    }
+)
+
+SENSORS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_POWER_SENSOR): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor"),
+        ),
+        vol.Required(CONF_PF_SENSOR): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor"),
+        ),
+    }
+)
+
+PRIORITY_DEVICES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_PRIORITY_DEVICES): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor", multiple=True),
+        ),
+    }
+)
+
+
+@functools.lru_cache(maxsize=4)
+def battery_config_schema(battery_count: int) -> vol.Schema:
+    """Return the battery configuration schema for the given battery count."""
+    # Generate schema for all batteries
+    schema: dict[vol.Marker, Any] = {}
+    battery_choices = []
+
+    for i in range(1, battery_count + 1):
+        battery_id = f"battery_{chr(96 + i)}"
+        battery_choices.append(battery_id)
+
+        schema[vol.Required(f"{battery_id}_host")] = str
+        schema[vol.Required(f"{battery_id}_port", default=DEFAULT_PORT)] = vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=65535)
+        )
+
+    # Add master battery selection
+    schema[vol.Required(CONF_MASTER_BATTERY)] = vol.In(battery_choices)
+
+    return vol.Schema(schema)
+
 
 class SAXBatteryConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for SAX Battery."""
@@ -36,7 +106,6 @@ class SAXBatteryConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._data: dict[str, Any] = {}
         self._battery_count: int | None = None
-        self._device_id: str = str(uuid.uuid4())  # Generate unique device ID
         self._pilot_from_ha: bool = False
         self._limit_power: bool = False
 
@@ -48,19 +117,14 @@ class SAXBatteryConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Store battery count and move to battery configuration
             self._battery_count = user_input[CONF_BATTERY_COUNT]
             self._data.update(user_input)
-            self._data[CONF_DEVICE_ID] = self._device_id  # Store device ID
+            # Generate the unique device ID only once the user commits to a setup
+            self._data[CONF_DEVICE_ID] = str(uuid.uuid4())
             return await self.async_step_control_options()
 
         # Initial form - just ask for battery count
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_BATTERY_COUNT, default=1): vol.All(
-                        vol.Coerce(int), vol.Range(min=1, max=3)
-                    ),
-                }
-            ),
+            data_schema=USER_SCHEMA,
             errors=errors,
         )
 
@@ -81,12 +145,7 @@ class SAXBatteryConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="control_options",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_PILOT_FROM_HA, default=False): bool,
-                    vol.Required(CONF_LIMIT_POWER, default=False): bool,
-                }
-            ),
+            data_schema=CONTROL_OPTIONS_SCHEMA,
             errors=errors,
         )
 
@@ -97,43 +156,29 @@ class SAXBatteryConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            # Validate MIN_SOC
             try:
-                # Validate MIN_SOC
-                try:
-                    min_soc = int(user_input[CONF_MIN_SOC])
-                    if not 0 <= min_soc <= 100:
-                        errors[CONF_MIN_SOC] = "invalid_min_soc"
-                except (ValueError, TypeError):
+                min_soc = int(user_input[CONF_MIN_SOC])
+                if not 0 <= min_soc <= 100:
                     errors[CONF_MIN_SOC] = "invalid_min_soc"
+            except (ValueError, TypeError):
+                errors[CONF_MIN_SOC] = "invalid_min_soc"
 
-                # Validate AUTO_PILOT_INTERVAL
-                try:
-                    auto_pilot_interval = int(user_input[CONF_AUTO_PILOT_INTERVAL])
-                    if not 5 <= auto_pilot_interval <= 300:
-                        errors[CONF_AUTO_PILOT_INTERVAL] = "invalid_interval"
-                except (ValueError, TypeError):
+            # Validate AUTO_PILOT_INTERVAL
+            try:
+                auto_pilot_interval = int(user_input[CONF_AUTO_PILOT_INTERVAL])
+                if not 5 <= auto_pilot_interval <= 300:
                     errors[CONF_AUTO_PILOT_INTERVAL] = "invalid_interval"
+            except (ValueError, TypeError):
+                errors[CONF_AUTO_PILOT_INTERVAL] = "invalid_interval"
 
-                if not errors:
-                    self._data.update(user_input)
-                    return await self.async_step_sensors()
-
-            except vol.Invalid:
-                errors["base"] = "invalid_pilot_options"
+            if not errors:
+                self._data.update(user_input)
+                return await self.async_step_sensors()
 
         return self.async_show_form(
             step_id="pilot_options",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_MIN_SOC, default=DEFAULT_MIN_SOC): vol.All(
-                        vol.Coerce(int), vol.Range(min=0, max=100)
-                    ),
-                    vol.Required(
-                        CONF_AUTO_PILOT_INTERVAL, default=DEFAULT_AUTO_PILOT_INTERVAL
-                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=300)),
-                    vol.Required(CONF_ENABLE_SOLAR_CHARGING, default=True): bool,
-                }
-            ),
+            data_schema=PILOT_OPTIONS_SCHEMA,
             errors=errors,
         )
 
@@ -145,27 +190,13 @@ class SAXBatteryConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._data.update(user_input)
             return await self.async_step_priority_devices()
 
-        # Only make fields required if piloting from HA
-        schema = {}
-        if self._pilot_from_ha:
-            schema.update(
-                {
-                    vol.Required(CONF_POWER_SENSOR): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="sensor"),
-                    ),
-                    vol.Required(CONF_PF_SENSOR): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="sensor"),
-                    ),
-                }
-            )
-
-        # If no sensors are needed, skip this step
-        if not schema:
+        # Sensors are only needed when piloting from HA, otherwise skip this step
+        if not self._pilot_from_ha:
             return await self.async_step_battery_config()
 
         return self.async_show_form(
             step_id="sensors",
-            data_schema=vol.Schema(schema),
+            data_schema=SENSORS_SCHEMA,
             errors=errors,
         )
 
@@ -181,13 +212,7 @@ class SAXBatteryConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="priority_devices",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(CONF_PRIORITY_DEVICES): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="sensor", multiple=True),
-                    ),
-                }
-            ),
+            data_schema=PRIORITY_DEVICES_SCHEMA,
             errors=errors,
             description_placeholders={
                 "priority_devices_description": "Select devices that should have priority over battery usage (e.g., EV charger, heat pump)"
@@ -209,25 +234,9 @@ class SAXBatteryConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data=self._data,
             )
 
-        # Generate schema for all batteries
-        schema: dict[vol.Marker, Any] = {}
-        battery_choices = []
-        battery_count = self._battery_count or 0  # Default to 0 if None
-
-        for i in range(1, battery_count + 1):
-            battery_id = f"battery_{chr(96 + i)}"
-            battery_choices.append(battery_id)
-
-            schema[vol.Required(f"{battery_id}_host")] = str
-            schema[vol.Required(f"{battery_id}_port", default=DEFAULT_PORT)] = vol.All(
-                vol.Coerce(int), vol.Range(min=1, max=65535)
-            )
-
-        # Add master battery selection
-        schema[vol.Required(CONF_MASTER_BATTERY)] = vol.In(battery_choices)
-
         return self.async_show_form(
             step_id="battery_config",
-            data_schema=vol.Schema(schema),
+            # Default to 0 batteries if the count is unknown
+            data_schema=battery_config_schema(self._battery_count or 0),
             errors=errors,
         )
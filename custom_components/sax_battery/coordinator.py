@@ -9,13 +9,33 @@ from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import CONF_DEVICE_ID
+from .const import CONF_DEVICE_ID, DOMAIN, SAX_STATUS
 from .hub import HubConnectionError, HubException, SAXBatteryHub
 
 _LOGGER = logging.getLogger(__name__)
 
+# Refresh requests within this window (seconds) share one bulk read
+REQUEST_REFRESH_COOLDOWN = 0.1
+
+# Writable register layout shared by all batteries (read-only, do not mutate)
+BATTERY_REGISTERS: dict[str, dict[str, Any]] = {
+    SAX_STATUS: {
+        "address": 45,
+        "count": 1,
+        "data_type": "int",
+        "slave": 64,
+        "scan_interval": 60,
+        "state_on": 3,
+        "state_off": 1,
+        "command_on": 2,
+        "command_off": 1,
+    }
+}
+
 
 class SAXBatteryCoordinator(DataUpdateCoordinator):
     """SAX Battery data update coordinator."""
@@ -33,11 +53,30 @@ class SAXBatteryCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name="SAX Battery Coordinator",
             update_interval=timedelta(seconds=scan_interval),
+            # Skip listener callbacks when a poll returns the same readings
+            always_update=False,
+            # Coalesce refresh requests (switch writes, polled combined sensors)
+            # arriving close together into a single Modbus read
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
         self._hub = hub
         self.entry = entry
         self.device_id = entry.data.get(CONF_DEVICE_ID)
 
+        # Device info shared by every entity (read-only, do not mutate)
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.device_id)},
+            name="SAX Battery System",
+            manufacturer="SAX",
+            model="SAX Battery",
+            sw_version="1.0",
+        )
+
         # Add other attributes that platforms might expect
         self.power_sensor_entity_id = entry.data.get("power_sensor_entity_id")
         self.pf_sensor_entity_id = entry.data.get("pf_sensor_entity_id")
@@ -49,6 +88,10 @@ class SAXBatteryCoordinator(DataUpdateCoordinator):
             # Set each battery's _data_manager reference to this coordinator
             battery._data_manager = self  # noqa: SLF001
 
+        # Per-battery data keys used for the combined values, built once
+        self.soc_keys = tuple(f"{battery_id}_soc" for battery_id in self.batteries)
+        self.power_keys = tuple(f"{battery_id}_power" for battery_id in self.batteries)
+
         # Add master_battery attribute for compatibility (use first battery)
         self.master_battery = (
             next(iter(hub.batteries.values())) if hub.batteries else None
@@ -61,21 +104,11 @@ class SAXBatteryCoordinator(DataUpdateCoordinator):
         self.last_updates: dict[str, Any] = {}
 
         # Add modbus_registers for compatibility with switch platform
-        self.modbus_registers = {}
-        for battery_id in self.batteries:
-            self.modbus_registers[battery_id] = {
-                "sax_status": {
-                    "address": 45,
-                    "count": 1,
-                    "data_type": "int",
-                    "slave": 64,
-                    "scan_interval": 60,
-                    "state_on": 3,
-                    "state_off": 1,
-                    "command_on": 2,
-                    "command_off": 1,
-                }
-            }
+        # (the register layout is identical for every battery, so share it)
+        self.modbus_registers = dict.fromkeys(self.batteries, BATTERY_REGISTERS)
+
+        # Bumped on every successful fetch so consumers can cache derived values
+        self.data_version = 0
 
         # Add global modbus lock for write operations
         self._write_lock = asyncio.Lock()
@@ -171,6 +204,7 @@ class SAXBatteryCoordinator(DataUpdateCoordinator):
 
                 # Merge raw data with combined values
                 raw_data.update(combined_data)
+                self.data_version += 1
 
                 return raw_data  # noqa: TRY300
 
@@ -186,33 +220,20 @@ class SAXBatteryCoordinator(DataUpdateCoordinator):
         """Calculate combined values from all batteries."""
         combined = {}
 
-        # Calculate combined SOC (average of all batteries)
-        soc_sum = 0.0
-        soc_count = 0
-
-        # Calculate combined power (sum of all batteries)
-        power_sum = 0.0
-
-        # Iterate through all configured batteries
-        for battery_id in self.batteries:
-            # Get SOC for this battery
-            soc_key = f"{battery_id}_soc"
-            if soc_key in data and data[soc_key] is not None:
-                soc_sum += data[soc_key]
-                soc_count += 1
-
-            # Get power for this battery
-            power_key = f"{battery_id}_power"
-            if power_key in data and data[power_key] is not None:
-                power_sum += data[power_key]
+        # Gather the SOC values present for all configured batteries
+        socs = [soc for key in self.soc_keys if (soc := data.get(key)) is not None]
+        soc_count = len(socs)
 
         # Calculate average SOC
         if soc_count > 0:
-            combined["combined_soc"] = round(soc_sum / soc_count, 1)
+            combined["combined_soc"] = round(sum(socs) / soc_count, 1)
         else:
             combined["combined_soc"] = None
 
-        # Set combined power
+        # Calculate combined power (sum of all batteries)
+        power_sum = sum(
+            power for key in self.power_keys if (power := data.get(key)) is not None
+        )
         combined["combined_power"] = round(power_sum, 1) if power_sum != 0 else 0.0
 
         _LOGGER.debug(
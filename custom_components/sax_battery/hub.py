@@ -23,6 +23,7 @@ READ_TIMEOUT = 8.0  # Increased from 5 to 8 seconds
 RETRY_DELAY = 1.0  # Increased from 0.5 to 1.0 second
 WRITE_DELAY = 2.0  # New: Delay before writes to avoid conflicts
 GLOBAL_DELAY = 0.1  # New: Small delay between all operations
+MAX_READ_COUNT = 125  # Modbus limit of registers per read request
 
 
 class HubException(HomeAssistantError):
@@ -254,7 +255,7 @@ class SAXBatteryHub:
     ) -> list[int]:
         """Read holding registers with timeout protection."""
         if battery_id is None:
-            battery_id = list(self.batteries.keys())[0] if self.batteries else ""
+            battery_id = next(iter(self.batteries), "")
 
         _LOGGER.debug(
             "Reading %d registers from address %d (slave %d) for battery %s",
@@ -508,6 +509,14 @@ class SAXBattery:
         self.host = host
         self.port = port
         self._register_map = self._get_register_map()
+        # Names of status registers, whose values must stay integers
+        self._status_register_names = frozenset(
+            config["name"]
+            for config in self._register_map.values()
+            if "status" in config.get("name", "").lower()
+        )
+        # Contiguous registers are fetched together, one request per block
+        self._read_blocks = self._build_read_blocks()
         self._data_manager: Any = None  # Will be set by coordinator
 
     def _get_register_map(self) -> dict[str, dict[str, Any]]:
@@ -788,6 +797,42 @@ class SAXBattery:
             },
         }
 
+    def _build_read_blocks(self) -> list[dict[str, Any]]:
+        """Group the register map into contiguous blocks per slave."""
+        blocks: list[dict[str, Any]] = []
+        ordered = sorted(
+            self._register_map.items(),
+            key=lambda item: (item[1].get("slave", 1), item[1]["address"]),
+        )
+
+        for key, config in ordered:
+            slave_id = config.get("slave", 1)
+            address = config["address"]
+            count = config["count"]
+
+            # Only extend a block without gaps, unused addresses may not be readable
+            if blocks:
+                block = blocks[-1]
+                if (
+                    block["slave"] == slave_id
+                    and block["address"] + block["count"] == address
+                    and block["count"] + count <= MAX_READ_COUNT
+                ):
+                    block["registers"].append((key, block["count"], config))
+                    block["count"] += count
+                    continue
+
+            blocks.append(
+                {
+                    "slave": slave_id,
+                    "address": address,
+                    "count": count,
+                    "registers": [(key, 0, config)],
+                }
+            )
+
+        return blocks
+
     def _convert_value(
         self, raw_value: int | list[int], config: dict[str, Any]
     ) -> float | int:
@@ -821,11 +866,8 @@ class SAXBattery:
         if scale != 1:
             return float(value * scale)
 
-        # Special cases for specific sensor types
-        register_name = config.get("name", "").lower()
-
         # Status sensors should remain as integers
-        if "status" in register_name:
+        if config.get("name") in self._status_register_names:
             return int(value)
 
         # Special case for power factor - always return as float even with scale 1
@@ -842,63 +884,117 @@ class SAXBattery:
 
     async def read_data(self) -> dict[str, float | int | None]:
         """Read battery data."""
-        _LOGGER.debug("Starting to read battery data...")
         _LOGGER.debug(
-            "Will read %d registers: %s",
+            "Will read %d registers in %d requests: %s",
             len(self._register_map),
+            len(self._read_blocks),
             list(self._register_map.keys()),
         )
         data: dict[str, float | int | None] = {}
 
-        for key, config in self._register_map.items():
-            slave_id = config.get("slave", 1)  # Get slave ID from config
+        for block in self._read_blocks:
+            if len(block["registers"]) == 1:
+                key, _, config = block["registers"][0]
+                await self._read_register(key, config, data)
+                continue
+
+            raw_registers = await self._read_block(block)
+            if raw_registers is None:
+                # One unreadable address fails the whole block, read its
+                # registers one by one so the others still get values
+                for key, _, config in block["registers"]:
+                    await self._read_register(key, config, data)
+                continue
+
+            # Slice each register's words out of the block
+            for key, offset, config in block["registers"]:
+                self._store_value(
+                    data, key, config, raw_registers[offset : offset + config["count"]]
+                )
+
+        _LOGGER.debug("Finished reading battery data, got %d values", len(data))
+        return data
+
+    async def _read_block(self, block: dict[str, Any]) -> list[int] | None:
+        """Read a block of contiguous registers, None if it can't be read whole."""
+        _LOGGER.debug(
+            "Reading block: address=%d, count=%d, slave=%d",
+            block["address"],
+            block["count"],
+            block["slave"],
+        )
+        try:
+            raw_registers = await self._hub.modbus_read_holding_registers(
+                address=block["address"],
+                count=block["count"],
+                slave=block["slave"],
+                battery_id=self.battery_id,  # Pass battery_id to specify which client to use
+            )
+        except (HubException, ConnectionException, ModbusIOException) as e:
             _LOGGER.debug(
-                "Reading register for %s: address=%d, count=%d, slave=%d",
-                key,
-                config["address"],
-                config["count"],
-                slave_id,
+                "Error reading %d registers (address %d): %s",
+                block["count"],
+                block["address"],
+                e,
             )
-            try:
-                raw_registers = await self._hub.modbus_read_holding_registers(
-                    address=config["address"],
-                    count=config["count"],
-                    slave=slave_id,
-                    battery_id=self.battery_id,  # Pass battery_id to specify which client to use
-                )
+            return None
 
-                if raw_registers is not None:
-                    _LOGGER.debug(
-                        "Successfully read %d registers for %s: %s",
-                        len(raw_registers),
-                        key,
-                        raw_registers,
-                    )
-                    if config["count"] == 1:
-                        value = self._convert_value(raw_registers[0], config)
-                    else:
-                        value = self._convert_value(raw_registers, config)
+        if raw_registers is None or len(raw_registers) < block["count"]:
+            _LOGGER.debug(
+                "Incomplete data for %d registers (address %d)",
+                block["count"],
+                block["address"],
+            )
+            return None
 
-                    data[key] = value
-                    _LOGGER.debug(
-                        "Converted value for %s: %s %s",
-                        key,
-                        value,
-                        config.get("unit", ""),
-                    )
-                else:
-                    _LOGGER.warning(
-                        "No data received for %s (address %d)", key, config["address"]
-                    )
+        return raw_registers
 
-            except (HubException, ConnectionException, ModbusIOException) as e:
-                _LOGGER.error(
-                    "Error reading %s (address %d): %s", key, config["address"], e
-                )
-                data[key] = None
+    async def _read_register(
+        self, key: str, config: dict[str, Any], data: dict[str, float | int | None]
+    ) -> None:
+        """Read a single register into data."""
+        try:
+            raw_registers = await self._hub.modbus_read_holding_registers(
+                address=config["address"],
+                count=config["count"],
+                slave=config.get("slave", 1),
+                battery_id=self.battery_id,  # Pass battery_id to specify which client to use
+            )
+        except (HubException, ConnectionException, ModbusIOException) as e:
+            _LOGGER.error(
+                "Error reading %s (address %d): %s", key, config["address"], e
+            )
+            data[key] = None
+            return
 
-        _LOGGER.debug("Finished reading battery data, got %d values", len(data))
-        return data
+        if raw_registers is None:
+            _LOGGER.warning(
+                "No data received for %s (address %d)", key, config["address"]
+            )
+            return
+
+        self._store_value(data, key, config, raw_registers)
+
+    def _store_value(
+        self,
+        data: dict[str, float | int | None],
+        key: str,
+        config: dict[str, Any],
+        raw_registers: list[int],
+    ) -> None:
+        """Convert a register's raw words and store the value in data."""
+        if config["count"] == 1:
+            value = self._convert_value(raw_registers[0], config)
+        else:
+            value = self._convert_value(raw_registers, config)
+
+        data[key] = value
+        _LOGGER.debug(
+            "Converted value for %s: %s %s",
+            key,
+            value,
+            config.get("unit", ""),
+        )
 
 
 async def create_hub(hass: HomeAssistant, config: dict[str, Any]) -> SAXBatteryHub:
@@ -79,13 +79,7 @@ class SAXBatteryMaxChargeNumber(NumberEntity):
         self._track_time_remove: Callable[[], None] | None = None
 
         # Add device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, self._coordinator.device_id)},
-            "name": "SAX Battery System",
-            "manufacturer": "SAX",
-            "model": "SAX Battery",
-            "sw_version": "1.0",
-        }
+        self._attr_device_info = self._coordinator.device_info
 
     async def async_added_to_hass(self) -> None:
         """Set up periodic writes."""
@@ -213,13 +207,7 @@ class SAXBatteryMaxDischargeNumber(NumberEntity):
         self._track_time_remove: Callable[[], None] | None = None
 
         # Add device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, self._coordinator.device_id)},
-            "name": "SAX Battery System",
-            "manufacturer": "SAX",
-            "model": "SAX Battery",
-            "sw_version": "1.0",
-        }
+        self._attr_device_info = self._coordinator.device_info
 
     async def async_added_to_hass(self) -> None:
         """Set up periodic writes."""
@@ -342,13 +330,7 @@ class SAXBatteryPilotIntervalNumber(NumberEntity):
         self._attr_mode = NumberMode.SLIDER
 
         # Add device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, self._coordinator.device_id)},
-            "name": "SAX Battery System",
-            "manufacturer": "SAX",
-            "model": "SAX Battery",
-            "sw_version": "1.0",
-        }
+        self._attr_device_info = self._coordinator.device_info
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the pilot interval value."""
@@ -387,13 +369,7 @@ class SAXBatteryMinSOCNumber(NumberEntity):
         self._attr_mode = NumberMode.SLIDER
 
         # Add device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, self._coordinator.device_id)},
-            "name": "SAX Battery System",
-            "manufacturer": "SAX",
-            "model": "SAX Battery",
-            "sw_version": "1.0",
-        }
+        self._attr_device_info = self._coordinator.device_info
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the minimum SoC value."""
@@ -437,23 +413,16 @@ class SAXBatteryManualPowerEntity(NumberEntity):
         self._attr_mode = NumberMode.BOX
 
         # Add device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.device_id)},
-            "name": "SAX Battery System",
-            "manufacturer": "SAX",
-            "model": "SAX Battery",
-            "sw_version": "1.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float | None:
         """Return the current manual power setting."""
         # Get the value from the pilot if available
-        sax_data = self.hass.data[DOMAIN][self._coordinator.config_entry.entry_id]
-        if hasattr(sax_data, "pilot") and sax_data.pilot:
+        if pilot := getattr(self._coordinator, "pilot", None):
             return (
-                float(sax_data.pilot.calculated_power)
-                if sax_data.pilot.calculated_power is not None
+                float(pilot.calculated_power)
+                if pilot.calculated_power is not None
                 else 0.0
             )
         return self._attr_native_value
@@ -476,8 +445,7 @@ class SAXBatteryManualPowerEntity(NumberEntity):
         self._attr_native_value = value
 
         # Get the pilot instance and update its calculated power
-        sax_data = self.hass.data[DOMAIN][self._coordinator.config_entry.entry_id]
-        if hasattr(sax_data, "pilot") and sax_data.pilot:
-            await sax_data.pilot.set_manual_power(value)
+        if pilot := getattr(self._coordinator, "pilot", None):
+            await pilot.set_manual_power(value)
         else:
             _LOGGER.warning("Pilot not available to set manual power")
@@ -3,7 +3,6 @@
 import asyncio
 from collections.abc import Callable
 from datetime import timedelta
-import inspect
 import logging
 import time
 from typing import Any
@@ -11,9 +10,12 @@ from typing import Any
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.const import UnitOfPower
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
 from homeassistant.helpers.entity_component import EntityComponent
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
 
 from .const import (
     CONF_AUTO_PILOT_INTERVAL,
@@ -32,6 +34,12 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# An unchanged power command is rewritten on the first pilot tick once the last
+# write is this old (seconds), whatever the tick length. With the default 60s
+# tick every other unchanged write is skipped. Ticks of this length or longer
+# write every time.
+POWER_COMMAND_REFRESH_INTERVAL = 120
+
 
 async def async_setup_pilot(hass: HomeAssistant, entry_id: str) -> bool:
     """Set up the SAX Battery pilot service."""
@@ -71,35 +79,43 @@ class SAXBatteryPilot:
 
         # Configuration values
         self._update_config_values()
-        self.power_sensor_entity_id = self.entry.data.get(CONF_POWER_SENSOR)
-        self.pf_sensor_entity_id = self.entry.data.get(CONF_PF_SENSOR)
-        self.priority_devices = self.entry.data.get(CONF_PRIORITY_DEVICES, [])
-        self.min_soc = self.entry.data.get(CONF_MIN_SOC, DEFAULT_MIN_SOC)
-        self.update_interval = self.entry.data.get(
-            CONF_AUTO_PILOT_INTERVAL, DEFAULT_AUTO_PILOT_INTERVAL
-        )
-        self.solar_charging_enabled = self.entry.data.get(
-            CONF_ENABLE_SOLAR_CHARGING, True
-        )
 
         # Calculated values
         self.calculated_power = 0.0
         self.max_discharge_power = self.battery_count * 3600
         self.max_charge_power = self.battery_count * 4500
 
-        # Modbus
+        # Modbus - resolve the write target once
         self.master_battery = sax_data.master_battery
+        self._hub = sax_data.hub
+        # Use master battery ID or first available battery
+        self._master_battery_id: str | None = getattr(
+            sax_data, "master_battery_id", None
+        ) or next(iter(getattr(sax_data, "batteries", {})), None)
+        if self._master_battery_id is None:
+            _LOGGER.error("No master battery ID available")
+        self._last_command: tuple[int, int] | None = None
+        self._last_command_time = 0.0
+        self._write_lock = asyncio.Lock()
+        self._pending_command: tuple[float, float] | None = None
+
+        # Priority device power, maintained from state change events
+        self._priority_power: dict[str, float] = {}
+        self._priority_power_total = 0.0
 
         # Track state
         self._remove_interval_update: Callable[[], None] | None = None
         self._remove_config_update: Callable[[], None] | None = None
+        self._remove_priority_tracking: Callable[[], None] | None = None
         self._running = False
 
     def _update_config_values(self) -> None:
         """Update configuration values from entry data."""
         self.power_sensor_entity_id = self.entry.data.get(CONF_POWER_SENSOR)
         self.pf_sensor_entity_id = self.entry.data.get(CONF_PF_SENSOR)
-        self.priority_devices = self.entry.data.get(CONF_PRIORITY_DEVICES, [])
+        self.priority_devices: tuple[str, ...] = tuple(
+            self.entry.data.get(CONF_PRIORITY_DEVICES) or ()
+        )
         self.min_soc = self.entry.data.get(CONF_MIN_SOC, DEFAULT_MIN_SOC)
         self.update_interval = self.entry.data.get(
             CONF_AUTO_PILOT_INTERVAL, DEFAULT_AUTO_PILOT_INTERVAL
@@ -107,6 +123,9 @@ class SAXBatteryPilot:
         self.solar_charging_enabled = self.entry.data.get(
             CONF_ENABLE_SOLAR_CHARGING, True
         )
+        self.manual_control_enabled = bool(
+            self.entry.data.get(CONF_MANUAL_CONTROL, False)
+        )
         _LOGGER.debug(
             "Updated config values - min_soc: %s%%, update_interval: %ss",
             self.min_soc,
@@ -118,9 +137,15 @@ class SAXBatteryPilot:
         if self._running:
             return
 
+        # Drop any listeners left over from a previous start
+        self._async_remove_listeners()
+
         self._running = True
         self._remove_interval_update = async_track_time_interval(
-            self.hass, self._async_update_pilot, timedelta(seconds=self.update_interval)
+            self.hass,
+            self._async_update_pilot,
+            timedelta(seconds=self.update_interval),
+            cancel_on_shutdown=True,
         )
 
         # Add listener for config entry updates
@@ -128,8 +153,13 @@ class SAXBatteryPilot:
             self._async_config_updated
         )
 
-        # Do initial calculation
-        await self._async_update_pilot(None)
+        # Keep the priority device power total up to date
+        self._async_track_priority_devices()
+
+        # Do initial calculation without blocking config entry setup
+        self.hass.async_create_background_task(
+            self._async_update_pilot(None), "sax_pilot_initial"
+        )
 
         _LOGGER.info(
             "SAX Battery pilot started with %ss interval", self.update_interval
@@ -139,6 +169,8 @@ class SAXBatteryPilot:
         """Handle config entry updates."""
         self.entry = entry
         self._update_config_values()
+        if self._running:
+            self._async_track_priority_devices()
         # Apply new configuration immediately
         await self._async_update_pilot(None)
         _LOGGER.info("SAX Battery pilot configuration updated")
@@ -148,6 +180,14 @@ class SAXBatteryPilot:
         if not self._running:
             return
 
+        self._async_remove_listeners()
+
+        self._running = False
+        _LOGGER.info("SAX Battery pilot stopped")
+
+    @callback
+    def _async_remove_listeners(self) -> None:
+        """Remove the interval, config update and priority device listeners."""
         if self._remove_interval_update is not None:
             self._remove_interval_update()
             self._remove_interval_update = None
@@ -156,51 +196,70 @@ class SAXBatteryPilot:
             self._remove_config_update()
             self._remove_config_update = None
 
-        self._running = False
-        _LOGGER.info("SAX Battery pilot stopped")
+        if self._remove_priority_tracking is not None:
+            self._remove_priority_tracking()
+            self._remove_priority_tracking = None
+
+    @callback
+    def _async_track_priority_devices(self) -> None:
+        """(Re)subscribe to priority devices and seed the power total."""
+        if self._remove_priority_tracking is not None:
+            self._remove_priority_tracking()
+            self._remove_priority_tracking = None
+
+        self._priority_power = {}
+        for device_id in self.priority_devices:
+            power = self._parse_priority_power(
+                device_id, self.hass.states.get(device_id)
+            )
+            if power is not None:
+                self._priority_power[device_id] = power
+        self._priority_power_total = sum(self._priority_power.values())
 
-    async def _async_update_pilot(self, now: Any = None) -> None:
-        """Update the pilot calculations and send to battery."""
-        # Enhanced logging to track what's calling this method
-        caller_frame = inspect.currentframe()
-        caller_info = "unknown"
-        if caller_frame and caller_frame.f_back:
-            caller_info = f"{caller_frame.f_back.f_code.co_filename}:{caller_frame.f_back.f_lineno}"
-            caller_info = (
-                caller_info.split("/")[-1] if "/" in caller_info else caller_info
+        if self.priority_devices:
+            self._remove_priority_tracking = async_track_state_change_event(
+                self.hass, self.priority_devices, self._async_priority_device_changed
             )
 
-        _LOGGER.info(
-            "Pilot update called from: %s, now parameter: %s", caller_info, now
-        )
+    @callback
+    def _async_priority_device_changed(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Apply the power delta of a changed priority device to the total."""
+        device_id = event.data["entity_id"]
+        old_power = self._priority_power.pop(device_id, 0.0)
+        new_power = self._parse_priority_power(device_id, event.data["new_state"])
+        # A removed, unknown or unavailable device counts as 0W
+        if new_power is not None:
+            self._priority_power[device_id] = new_power
+        self._priority_power_total += (new_power or 0.0) - old_power
+
+    @staticmethod
+    def _parse_priority_power(device_id: str, state: Any) -> float | None:
+        """Return the power reported by a priority device state, if valid."""
+        if state is None or state.state in ("unknown", "unavailable"):
+            return None
+        try:
+            return float(state.state)
+        except (ValueError, TypeError):
+            _LOGGER.warning("Could not convert state of %s to number", device_id)
+            return None
+
+    async def _async_update_pilot(self, now: Any = None) -> None:
+        """Update the pilot calculations and send to battery."""
+        # Read the combined SOC once for this tick
+        combined_soc = self._get_combined_soc()
 
         try:
             # Check if in manual mode - if so, skip automatic calculations entirely
-            if self.entry.data.get(CONF_MANUAL_CONTROL, False):
+            if self.manual_control_enabled:
                 # In manual mode, use the stored calculated_power value
                 manual_power = self.calculated_power
 
-                # Add debugging to see what we're actually reading
-                _LOGGER.debug(
-                    "Reading calculated_power from pilot: %sW", self.calculated_power
-                )
-                _LOGGER.debug("Manual power variable: %sW", manual_power)
-
-                # Get current combined SOC for constraint checks
-                combined_soc = (
-                    self.sax_data.data.get("combined_soc", 0)
-                    if self.sax_data.data
-                    else 0
-                )
-
-                _LOGGER.debug(
-                    "Manual control mode active - Manual power setting: %sW, Combined SOC: %s%%",
-                    manual_power,
-                    combined_soc,
-                )
-
                 # Apply SOC constraints to the manual power setting
-                constrained_power = await self._apply_soc_constraints(manual_power)
+                constrained_power = self._apply_soc_constraints(
+                    manual_power, combined_soc
+                )
                 if constrained_power != manual_power:
                     _LOGGER.info(
                         "Manual power adjusted from %sW to %sW due to SOC constraints",
@@ -209,10 +268,14 @@ class SAXBatteryPilot:
                     )
 
                 # Send the constrained manual power to the battery
-                await self.send_power_command(constrained_power, 1.0)
+                if not self._is_command_current(constrained_power, 1.0):
+                    self.hass.async_create_task(
+                        self.send_power_command(constrained_power, 1.0),
+                        eager_start=True,
+                    )
+                    _LOGGER.debug("Manual power %sW sent to battery", constrained_power)
 
                 # DON'T overwrite calculated_power in manual mode - preserve user input
-                _LOGGER.debug("Manual power %sW sent to battery", constrained_power)
                 return
 
             # Automatic mode - only execute if NOT in manual mode
@@ -264,17 +327,8 @@ class SAXBatteryPilot:
                 )
                 return
 
-            # Get priority device power consumption
-            priority_power = 0.0
-            for device_id in self.priority_devices:
-                device_state = self.hass.states.get(device_id)
-                if device_state is not None:
-                    try:
-                        priority_power += float(device_state.state)
-                    except (ValueError, TypeError):
-                        _LOGGER.warning(
-                            "Could not convert state of %s to number", device_id
-                        )
+            # Get priority device power consumption (kept current by events)
+            priority_power = self._priority_power_total
 
             # Get current combined battery power from coordinator
             battery_power = (
@@ -283,38 +337,8 @@ class SAXBatteryPilot:
                 else 0.0
             )
 
-            # Get combined SOC for logging
-            combined_soc = (
-                self.sax_data.data.get("combined_soc", 0) if self.sax_data.data else 0
-            )
-            _LOGGER.debug("Current combined SOC: %s%%", combined_soc)
-
             # Calculate target power
-            _LOGGER.debug(
-                "Starting calculation with total_power=%s, priority_power=%s, battery_power=%s",
-                total_power,
-                priority_power,
-                battery_power,
-            )
-
-            if priority_power > 50:
-                _LOGGER.debug(
-                    "Condition met: priority_power > 50 (%s > 50)", priority_power
-                )
-                net_power = 0.0
-                _LOGGER.debug("Set net_power = 0")
-            else:
-                _LOGGER.debug(
-                    "Condition met: priority_power <= 50 (%s <= 50)", priority_power
-                )
-                net_power = total_power - battery_power
-                _LOGGER.debug(
-                    "Calculated net_power = %s - %s = %s",
-                    total_power,
-                    battery_power,
-                    net_power,
-                )
-
+            net_power = 0.0 if priority_power > 50 else total_power - battery_power
             target_power = -net_power
 
             # Apply limits
@@ -323,70 +347,64 @@ class SAXBatteryPilot:
             )
 
             # Apply SOC constraints
-            _LOGGER.debug("Pre-constraint target power: %sW", target_power)
-            target_power = await self._apply_soc_constraints(target_power)
-            _LOGGER.debug("Post-constraint target power: %sW", target_power)
+            target_power = self._apply_soc_constraints(target_power, combined_soc)
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Pilot: total=%s priority=%s battery=%s net=%s target=%sW "
+                    "PF=%s SOC=%s%%",
+                    total_power,
+                    priority_power,
+                    battery_power,
+                    net_power,
+                    target_power,
+                    power_factor,
+                    combined_soc,
+                )
 
             # Update calculated power (only in automatic mode)
             self.calculated_power = target_power
 
             # Send to battery if solar charging is enabled
-            if self.solar_charging_enabled:
-                await self.send_power_command(target_power, power_factor)
-            else:
-                await self.send_power_command(0, power_factor)
-
-            _LOGGER.debug(
-                "Updated battery pilot: target power = %sW, PF = %s",
-                target_power,
-                power_factor,
-            )
+            command_power = target_power if self.solar_charging_enabled else 0
+            if not self._is_command_current(command_power, power_factor):
+                self.hass.async_create_task(
+                    self.send_power_command(command_power, power_factor),
+                    eager_start=True,
+                )
 
         except (ConnectionError, ValueError) as err:
             _LOGGER.error("Error in battery pilot update: %s", err)
 
-    async def _apply_soc_constraints(self, power_value: float) -> float:
-        """Apply SOC constraints to a power value."""
-        # Get current combined SOC from coordinator data
-        combined_soc = (
-            self.sax_data.data.get("combined_soc", 0) if self.sax_data.data else 0
+    def _is_command_current(self, power: float, power_factor: float) -> bool:
+        """Return True if this command was written within the refresh interval."""
+        return (
+            self._last_command == (int(power), int(power_factor * 10))
+            and time.monotonic() - self._last_command_time
+            < POWER_COMMAND_REFRESH_INTERVAL
         )
 
-        # Log the input values
-        _LOGGER.debug(
-            "Applying SOC constraints - Current combined SOC: %s%%, Min SOC: %s%%, Power: %sW",
-            combined_soc,
-            self.min_soc,
-            power_value,
-        )
+    def _get_combined_soc(self) -> float:
+        """Return the combined SOC from the latest coordinator data."""
+        data = self.sax_data.data
+        if not data:
+            return 0.0
+        return data.get("combined_soc") or 0.0
 
-        # Apply constraints
+    def _apply_soc_constraints(self, power_value: float, combined_soc: float) -> float:
+        """Apply SOC constraints to a power value."""
+        # Don't discharge below min SOC and don't charge above 100%
         original_value = power_value
+        upper = 0.0 if combined_soc < self.min_soc else self.max_charge_power
+        lower = 0.0 if combined_soc >= 100 else -self.max_discharge_power
+        power_value = max(lower, min(upper, power_value))
 
-        # Don't discharge below min SOC
-        if combined_soc < self.min_soc and power_value > 0:
-            power_value = 0
-            _LOGGER.debug(
-                "Battery combined SOC below minimum (%s%%), preventing discharge",
-                combined_soc,
-            )
-
-        # Don't charge above 100%
-        if combined_soc >= 100 and power_value < 0:
-            power_value = 0
-            _LOGGER.debug("Battery combined SOC at maximum (100%), preventing charge")
-
-        # Log if any change was made
         if original_value != power_value:
             _LOGGER.info(
                 "SOC constraint applied: changed power from %sW to %sW",
                 original_value,
                 power_value,
             )
-        else:
-            _LOGGER.debug(
-                "SOC constraint check: no change needed to power value %sW", power_value
-            )
 
         return power_value
 
@@ -395,7 +413,7 @@ class SAXBatteryPilot:
         self.solar_charging_enabled = enabled
 
         # Only trigger automatic calculations if NOT in manual mode
-        if enabled and not self.entry.data.get(CONF_MANUAL_CONTROL, False):
+        if enabled and not self.manual_control_enabled:
             # Recalculate and send current value (automatic mode only)
             await self._async_update_pilot()
         elif not enabled:
@@ -410,8 +428,10 @@ class SAXBatteryPilot:
         self.calculated_power = power_value
 
         # If in manual mode, apply constraints and send immediately
-        if self.entry.data.get(CONF_MANUAL_CONTROL, False):
-            constrained_power = await self._apply_soc_constraints(power_value)
+        if self.manual_control_enabled:
+            constrained_power = self._apply_soc_constraints(
+                power_value, self._get_combined_soc()
+            )
             await self.send_power_command(constrained_power, 1.0)
             _LOGGER.debug("Manual power set to %sW", constrained_power)
         else:
@@ -431,6 +451,7 @@ class SAXBatteryPilot:
                 self.hass,
                 self._async_update_pilot,
                 timedelta(seconds=self.update_interval),
+                cancel_on_shutdown=True,
             )
 
         _LOGGER.debug("Pilot update interval changed to %ss", self.update_interval)
@@ -483,7 +504,26 @@ class SAXBatteryPilot:
             _LOGGER.info("Manual power set to %sW", power_value)
 
     async def send_power_command(self, power: float, power_factor: float) -> None:
-        """Send power command to battery via coordinator."""
+        """Send power command to battery via coordinator.
+
+        Commands issued while a write is in flight are coalesced: only the
+        latest one is written once the current write has finished.
+        """
+        self._pending_command = (power, power_factor)
+        if self._write_lock.locked():
+            return
+
+        # Serialize writes so a slow Modbus response can't overlap a new command
+        async with self._write_lock:
+            while self._pending_command is not None:
+                power, power_factor = self._pending_command
+                self._pending_command = None
+                await self._async_write_power_command(power, power_factor)
+
+    async def _async_write_power_command(
+        self, power: float, power_factor: float
+    ) -> None:
+        """Write a power command to the master battery."""
         current_time = time.time()
 
         # Enhanced logging to track frequency
@@ -502,11 +542,8 @@ class SAXBatteryPilot:
         # Wait longer to avoid conflicts with coordinator reads
         await asyncio.sleep(0.5)  # Increased from 0.1 to 0.5 seconds
 
-        # Convert power format for two's complement
-        if power < 0:
-            power_int = (65536 + int(power)) & 0xFFFF
-        else:
-            power_int = int(power) & 0xFFFF
+        # Convert power format for two's complement (masking covers negatives)
+        power_int = int(power) & 0xFFFF
 
         # Convert PF to integer
         pf_int = int(power_factor * 10) & 0xFFFF
@@ -524,24 +561,14 @@ class SAXBatteryPilot:
 
         # Use the hub's write method instead of coordinator
         try:
-            # Get the coordinator's hub
-            hub = self.sax_data._hub if hasattr(self.sax_data, "_hub") else None  # noqa: SLF001
-            if not hub:
-                _LOGGER.error("No hub available for writing")
-                return
-
-            # Use master battery ID or first available battery
-            master_battery_id = getattr(self.sax_data, "master_battery_id", None)
-            if not master_battery_id and hasattr(self.sax_data, "batteries"):
-                master_battery_id = next(iter(self.sax_data.batteries.keys()))
-
-            if not master_battery_id:
-                _LOGGER.error("No master battery ID available")
+            # A missing master battery was already reported at init
+            if self._master_battery_id is None:
+                _LOGGER.debug("No write target, dropping power command: %sW", power)
                 return
 
             success = await asyncio.wait_for(
-                hub.modbus_write_registers(
-                    master_battery_id,
+                self._hub.modbus_write_registers(
+                    self._master_battery_id,
                     41,  # Starting register
                     values,
                     slave=64,  # Device ID for SAX battery system
@@ -550,6 +577,8 @@ class SAXBatteryPilot:
             )
 
             if success:
+                self._last_command = (int(power), int(power_factor * 10))
+                self._last_command_time = time.monotonic()
                 _LOGGER.debug("Power command sent successfully: %sW", power)
             else:
                 _LOGGER.error("Failed to send power command: %sW", power)
@@ -576,13 +605,7 @@ class SAXBatteryPilotPowerEntity(NumberEntity):
         self._attr_mode = NumberMode.BOX
 
         # Add device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, self._pilot.sax_data.device_id)},
-            "name": "SAX Battery System",
-            "manufacturer": "SAX",
-            "model": "SAX Battery",
-            "sw_version": "1.0",
-        }
+        self._attr_device_info = self._pilot.sax_data.device_info
 
     @property
     def native_value(self) -> float | None:
@@ -618,9 +641,12 @@ class SAXBatteryPilotPowerEntity(NumberEntity):
         )
 
         # If we're in manual mode, send the command immediately
-        if self._pilot.entry.data.get(CONF_MANUAL_CONTROL, False):
+        if self._pilot.manual_control_enabled:
             # Apply SOC constraints
-            constrained_value = await self._pilot._apply_soc_constraints(value)  # noqa: SLF001
+            constrained_value = self._pilot._apply_soc_constraints(  # noqa: SLF001
+                value,
+                self._pilot._get_combined_soc(),  # noqa: SLF001
+            )
             await self._pilot.send_power_command(constrained_value, 1.0)
 
             # Log what actually happened
@@ -650,13 +676,7 @@ class SAXBatterySolarChargingSwitch(SwitchEntity):
         self._attr_name = "Solar Charging"
 
         # Add device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, self._pilot.sax_data.device_id)},
-            "name": "SAX Battery System",
-            "manufacturer": "SAX",
-            "model": "SAX Battery",
-            "sw_version": "1.0",
-        }
+        self._attr_device_info = self._pilot.sax_data.device_info
 
     @property
     def is_on(self) -> bool | None:
@@ -670,7 +690,11 @@ class SAXBatterySolarChargingSwitch(SwitchEntity):
     @property
     def icon(self) -> str | None:
         """Return the icon to use for the switch."""
-        return "mdi:solar-power" if self.is_on else "mdi:solar-power-off"
+        return (
+            "mdi:solar-power"
+            if self._pilot.solar_charging_enabled
+            else "mdi:solar-power-off"
+        )
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on solar charging."""
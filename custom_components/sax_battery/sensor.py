@@ -34,6 +34,163 @@ from .coordinator import SAXBatteryCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+BATTERY_PREFIXES = ("battery_a_", "battery_b_", "battery_c_")
+# All battery prefixes share this length
+BATTERY_PREFIX_LEN = len(BATTERY_PREFIXES[0])
+
+SENSOR_NAMES: dict[str, str] = {
+    "soc": "SOC",
+    "power": "Power",
+    "smartmeter": "Smart Meter",
+    "capacity": "Capacity",
+    "cycles": "Cycles",
+    "temp": "Temperature",
+    "energy_produced": "Energy Produced",
+    "energy_consumed": "Energy Consumed",
+    "voltage_l1": "Voltage L1",
+    "voltage_l2": "Voltage L2",
+    "voltage_l3": "Voltage L3",
+    "current_l1": "Current L1",
+    "current_l2": "Current L2",
+    "current_l3": "Current L3",
+    "grid_frequency": "Grid Frequency",
+    "active_power_l1": "Active Power L1",
+    "active_power_l2": "Active Power L2",
+    "active_power_l3": "Active Power L3",
+    "apparent_power": "Apparent Power",
+    "reactive_power": "Reactive Power",
+    "power_factor": "Power Factor",
+    "phase_currents_sum": "Phase Currents Sum",
+    "ac_power_total": "AC Power Total",
+    "storage_status": "Storage Status",
+    "smartmeter_voltage_l1": "Smart Meter Voltage L1",
+    "smartmeter_voltage_l2": "Smart Meter Voltage L2",
+    "smartmeter_voltage_l3": "Smart Meter Voltage L3",
+    "smartmeter_current_l1": "Smart Meter Current L1",
+    "smartmeter_current_l2": "Smart Meter Current L2",
+    "smartmeter_current_l3": "Smart Meter Current L3",
+    "smartmeter_total_power": "Smart Meter Total Power",
+}
+
+SENSOR_DEVICE_CLASSES_AND_UNITS: dict[
+    str, tuple[SensorDeviceClass | None, str | None]
+] = {
+    "soc": (SensorDeviceClass.BATTERY, PERCENTAGE),
+    "power": (SensorDeviceClass.POWER, UnitOfPower.WATT),
+    "capacity": (SensorDeviceClass.ENERGY, UnitOfEnergy.WATT_HOUR),
+    "temp": (SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS),
+    "energy_produced": (SensorDeviceClass.ENERGY, UnitOfEnergy.KILO_WATT_HOUR),
+    "energy_consumed": (SensorDeviceClass.ENERGY, UnitOfEnergy.KILO_WATT_HOUR),
+    "voltage_l1": (SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT),
+    "voltage_l2": (SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT),
+    "voltage_l3": (SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT),
+    "current_l1": (SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE),
+    "current_l2": (SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE),
+    "current_l3": (SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE),
+    "grid_frequency": (SensorDeviceClass.FREQUENCY, UnitOfFrequency.HERTZ),
+    "active_power_l1": (SensorDeviceClass.POWER, UnitOfPower.WATT),
+    "active_power_l2": (SensorDeviceClass.POWER, UnitOfPower.WATT),
+    "active_power_l3": (SensorDeviceClass.POWER, UnitOfPower.WATT),
+    "apparent_power": (SensorDeviceClass.APPARENT_POWER, "VA"),
+    "reactive_power": (
+        SensorDeviceClass.REACTIVE_POWER,
+        "var",
+    ),  # Fixed: was "VAR"
+    "power_factor": (SensorDeviceClass.POWER_FACTOR, PERCENTAGE),
+    "phase_currents_sum": (
+        SensorDeviceClass.CURRENT,
+        UnitOfElectricCurrent.AMPERE,
+    ),
+    "ac_power_total": (SensorDeviceClass.POWER, UnitOfPower.WATT),
+    "smartmeter_voltage_l1": (
+        SensorDeviceClass.VOLTAGE,
+        UnitOfElectricPotential.VOLT,
+    ),
+    "smartmeter_voltage_l2": (
+        SensorDeviceClass.VOLTAGE,
+        UnitOfElectricPotential.VOLT,
+    ),
+    "smartmeter_voltage_l3": (
+        SensorDeviceClass.VOLTAGE,
+        UnitOfElectricPotential.VOLT,
+    ),
+    "smartmeter_current_l1": (
+        SensorDeviceClass.CURRENT,
+        UnitOfElectricCurrent.AMPERE,
+    ),
+    "smartmeter_current_l2": (
+        SensorDeviceClass.CURRENT,
+        UnitOfElectricCurrent.AMPERE,
+    ),
+    "smartmeter_current_l3": (
+        SensorDeviceClass.CURRENT,
+        UnitOfElectricCurrent.AMPERE,
+    ),
+    "smartmeter_total_power": (SensorDeviceClass.POWER, UnitOfPower.WATT),
+}
+
+TOTAL_INCREASING_SENSOR_KEYS = frozenset(
+    {"energy_produced", "energy_consumed", "cycles"}
+)
+
+MEASUREMENT_SENSOR_KEYS = frozenset(
+    {
+        "soc",
+        "power",
+        "temp",
+        "voltage_l1",
+        "voltage_l2",
+        "voltage_l3",
+        "current_l1",
+        "current_l2",
+        "current_l3",
+        "grid_frequency",
+        "active_power_l1",
+        "active_power_l2",
+        "active_power_l3",
+        "apparent_power",
+        "reactive_power",
+        "power_factor",  # Added missing power_factor
+        "phase_currents_sum",
+        "ac_power_total",
+        "smartmeter_voltage_l1",
+        "smartmeter_voltage_l2",
+        "smartmeter_voltage_l3",
+        "smartmeter_current_l1",
+        "smartmeter_current_l2",
+        "smartmeter_current_l3",
+        "smartmeter_total_power",
+    }
+)
+
+
+def strip_battery_prefix(key: str) -> str:
+    """Remove the battery prefix (battery_a_, battery_b_, ...) from a data key."""
+    if key.startswith(BATTERY_PREFIXES):
+        return key[BATTERY_PREFIX_LEN:]
+    return key
+
+
+def get_sensor_name(key: str) -> str:
+    """Get human-readable sensor name."""
+    return SENSOR_NAMES.get(key, key.replace("_", " ").title())
+
+
+def build_sensor_names(data_key: str, battery_name: str | None) -> tuple[str, str]:
+    """Return the unique ID and display name for a sensor data key."""
+    # Use battery-specific name if provided
+    if not battery_name:
+        return f"{DOMAIN}_{data_key}", get_sensor_name(data_key)
+
+    # Remove battery prefix (battery_a_, battery_b_, etc.) from data key
+    sensor_key = strip_battery_prefix(data_key)
+    battery_letter = battery_name.rsplit(maxsplit=1)[-1]
+    # Unique ID: sax_battery_a_sensor_key, name: Sax Battery A Sensor Name
+    return (
+        f"{DOMAIN}_battery_{battery_letter.lower()}_{sensor_key}",
+        f"Sax Battery {battery_letter.upper()} {get_sensor_name(sensor_key)}",
+    )
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -86,15 +243,22 @@ async def async_setup_entry(
     created_sensors: set[str] = set()
 
     # Create sensors for all data keys from the coordinator
-    if coordinator.data:
-        for key in coordinator.data:
+    if data := coordinator.data:
+        # Base keys already covered by a battery-specific sensor, built once
+        battery_base_keys = {
+            strip_battery_prefix(key)
+            for key in data
+            if key.startswith(BATTERY_PREFIXES)
+        }
+
+        for key in data:
             # Skip combined keys as they're handled above
             if key.startswith("combined_"):
                 continue
 
             # Handle battery-specific sensors (battery_a_, battery_b_, etc.)
             if key.startswith("battery_"):
-                for battery_prefix in ["battery_a_", "battery_b_", "battery_c_"]:
+                for battery_prefix in BATTERY_PREFIXES:
                     if key.startswith(battery_prefix):
                         battery_letter = battery_prefix.split("_")[1].upper()
                         battery_name = f"Battery {battery_letter}"
@@ -110,23 +274,11 @@ async def async_setup_entry(
                             )
                             created_sensors.add(sensor_key)
                         break
-            else:
-                # Handle non-battery-specific keys
-                # Only create if this isn't duplicating a battery-specific sensor
-                sensor_base_key = key
-
-                # Check if this sensor would duplicate a battery-specific one
-                is_duplicate = False
-                for battery_id in ["battery_a", "battery_b", "battery_c"]:
-                    battery_specific_key = f"{battery_id}_{sensor_base_key}"
-                    if battery_specific_key in coordinator.data:
-                        is_duplicate = True
-                        break
-
-                # Only create the non-prefixed sensor if it's not a duplicate
-                if not is_duplicate and key not in created_sensors:
-                    entities.append(SAXBatterySensor(coordinator, key))
-                    created_sensors.add(key)
+            # Handle non-battery-specific keys, only creating the sensor
+            # if it isn't duplicating a battery-specific one
+            elif key not in battery_base_keys and key not in created_sensors:
+                entities.append(SAXBatterySensor(coordinator, key))
+                created_sensors.add(key)
 
     # Add cumulative energy sensors with the configured master battery
     if master_battery_id:
@@ -162,16 +314,17 @@ class SAXBatteryCombinedSensor(CoordinatorEntity, SensorEntity):
         """Initialize the combined sensor."""
         super().__init__(coordinator)
         self._sensor_type = sensor_type
+        self._cached_version: int | None = None
+
+        # Match old naming convention exactly ("Sax Battery Combined SOC", ...)
+        self._attr_name = f"Sax Battery {name}"
 
-        # Match old naming convention exactly
         match sensor_type:
             case "combined_soc":
-                self._attr_name = "Sax Battery Combined SOC"
                 self._attr_device_class = SensorDeviceClass.BATTERY
                 self._attr_native_unit_of_measurement = PERCENTAGE
                 self._attr_state_class = SensorStateClass.MEASUREMENT
             case "combined_power":
-                self._attr_name = "Sax Battery Combined Power"
                 self._attr_device_class = SensorDeviceClass.POWER
                 self._attr_native_unit_of_measurement = UnitOfPower.WATT
                 self._attr_state_class = SensorStateClass.MEASUREMENT
@@ -179,13 +332,7 @@ class SAXBatteryCombinedSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"{DOMAIN}_{sensor_type}"
 
         # Add device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.device_id)},
-            "name": "SAX Battery System",
-            "manufacturer": "SAX",
-            "model": "SAX Battery",
-            "sw_version": "1.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def should_poll(self) -> bool:
@@ -195,16 +342,20 @@ class SAXBatteryCombinedSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> float | None:
         """Return the combined value."""
-        if not self.coordinator.data:
-            return None
-
-        return self.coordinator.data.get(self._sensor_type)
+        data = self.coordinator.data
+        return data.get(self._sensor_type) if data else None
 
     async def async_update(self) -> None:
         """Update the sensor by recalculating combined values."""
-        # Force coordinator update first
+        # Schedule a debounced refresh, this poll still uses the current data
         await self.coordinator.async_request_refresh()
 
+        # Skip recalculating until the coordinator has fetched new data
+        data_version = self.coordinator.data_version
+        if data_version == self._cached_version:
+            return
+        self._cached_version = data_version
+
         # Calculate combined values similar to old implementation
         match self._sensor_type:
             case "combined_power":
@@ -214,17 +365,14 @@ class SAXBatteryCombinedSensor(CoordinatorEntity, SensorEntity):
 
     async def _calculate_combined_power(self) -> None:
         """Calculate combined power from all batteries."""
-        total_power = 0.0
+        data = self.coordinator.data or {}
 
         # Sum power from all configured batteries
-        for battery_id in self.coordinator.batteries:
-            power_key = f"{battery_id}_power"
-            if (
-                self.coordinator.data
-                and power_key in self.coordinator.data
-                and self.coordinator.data[power_key] is not None
-            ):
-                total_power += self.coordinator.data[power_key]
+        total_power = sum(
+            power
+            for key in self.coordinator.power_keys
+            if (power := data.get(key)) is not None
+        )
 
         # Store in coordinator data for consistency
         if not self.coordinator.data:
@@ -242,23 +390,18 @@ class SAXBatteryCombinedSensor(CoordinatorEntity, SensorEntity):
 
     async def _calculate_combined_soc(self) -> None:
         """Calculate average SOC from all batteries."""
-        total_soc = 0.0
-        valid_batteries = 0
+        data = self.coordinator.data or {}
 
         # Calculate average SOC from all configured batteries
-        for battery_id in self.coordinator.batteries:
-            soc_key = f"{battery_id}_soc"
-            if (
-                self.coordinator.data
-                and soc_key in self.coordinator.data
-                and self.coordinator.data[soc_key] is not None
-            ):
-                total_soc += self.coordinator.data[soc_key]
-                valid_batteries += 1
+        socs = [
+            soc
+            for key in self.coordinator.soc_keys
+            if (soc := data.get(key)) is not None
+        ]
 
         # Calculate average if we have valid data
-        if valid_batteries > 0:
-            combined_soc = round(total_soc / valid_batteries, 1)
+        if socs:
+            combined_soc = round(sum(socs) / len(socs), 1)
 
             # Store in coordinator data
             if not self.coordinator.data:
@@ -289,6 +432,9 @@ class SAXBatteryCumulativeEnergyProducedSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._master_battery_id = master_battery_id
+        self._master_key = (
+            f"{master_battery_id}_energy_produced" if master_battery_id else None
+        )
         self._attr_device_class = SensorDeviceClass.ENERGY
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
         self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
@@ -304,13 +450,7 @@ class SAXBatteryCumulativeEnergyProducedSensor(CoordinatorEntity, SensorEntity):
         )
 
         # Add device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.device_id)},
-            "name": "SAX Battery System",
-            "manufacturer": "SAX",
-            "model": "SAX Battery",
-            "sw_version": "1.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float:
@@ -335,30 +475,25 @@ class SAXBatteryCumulativeEnergyProducedSensor(CoordinatorEntity, SensorEntity):
             )
 
             # Get the current energy produced value from master battery
-            if self.coordinator.data and self._master_battery_id:
+            data = self.coordinator.data
+            if data and self._master_key:
                 # Look for the master battery's energy produced sensor data
-                master_key = f"{self._master_battery_id}_energy_produced"
-                current_value = self.coordinator.data.get(master_key)
+                current_value = data.get(self._master_key)
 
                 # Debug: Show what master battery we're using and what keys are available
-                available_keys = (
-                    list(self.coordinator.data.keys()) if self.coordinator.data else []
-                )
-                energy_produced_keys = [
-                    k for k in available_keys if "energy_produced" in k
-                ]
-
-                _LOGGER.info(
-                    "Cumulative Energy Produced: Master battery ID: %s, "
-                    "Looking for key: '%s', Found value: %s, "
-                    "Available energy_produced keys: %s, "
-                    "All available keys: %s",
-                    self._master_battery_id,
-                    master_key,
-                    current_value,
-                    energy_produced_keys,
-                    available_keys[:10],  # Show first 10 keys to avoid log spam
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    available_keys = list(data)
+                    _LOGGER.debug(
+                        "Cumulative Energy Produced: Master battery ID: %s, "
+                        "Looking for key: '%s', Found value: %s, "
+                        "Available energy_produced keys: %s, "
+                        "All available keys: %s",
+                        self._master_battery_id,
+                        self._master_key,
+                        current_value,
+                        [k for k in available_keys if "energy_produced" in k],
+                        available_keys[:10],  # Show first 10 keys to avoid log spam
+                    )
 
                 if current_value is not None and current_value > 0:
                     # Update the cumulative value (accumulate charging energy)
@@ -404,6 +539,9 @@ class SAXBatteryCumulativeEnergyConsumedSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._master_battery_id = master_battery_id
+        self._master_key = (
+            f"{master_battery_id}_energy_consumed" if master_battery_id else None
+        )
         self._attr_device_class = SensorDeviceClass.ENERGY
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
         self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
@@ -413,13 +551,7 @@ class SAXBatteryCumulativeEnergyConsumedSensor(CoordinatorEntity, SensorEntity):
         self._cumulative_value = 0.0
 
         # Add device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.device_id)},
-            "name": "SAX Battery System",
-            "manufacturer": "SAX",
-            "model": "SAX Battery",
-            "sw_version": "1.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float:
@@ -452,29 +584,23 @@ class SAXBatteryCumulativeEnergyConsumedSensor(CoordinatorEntity, SensorEntity):
             )
 
             # Get the current energy consumed value from master battery
-            if self.coordinator.data and self._master_battery_id:
+            data = self.coordinator.data
+            if data and self._master_key:
                 # Look for the master battery's energy consumed sensor data
-                master_key = f"{self._master_battery_id}_energy_consumed"
-                current_value = self.coordinator.data.get(master_key)
+                current_value = data.get(self._master_key)
 
-                _LOGGER.debug(
-                    "Cumulative Energy Consumed: Looking for key '%s', found value: %s (type: %s)",
-                    master_key,
-                    current_value,
-                    type(current_value).__name__
-                    if current_value is not None
-                    else "None",
-                )
-
-                # Debug: Show all available keys
-                available_keys = (
-                    list(self.coordinator.data.keys()) if self.coordinator.data else []
-                )
-                energy_keys = [k for k in available_keys if "energy" in k.lower()]
-                _LOGGER.debug(
-                    "Available energy-related keys in coordinator data: %s",
-                    energy_keys,
-                )
+                # Debug: Show the lookup and all available energy keys
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Cumulative Energy Consumed: Looking for key '%s', found value: %s (type: %s)",
+                        self._master_key,
+                        current_value,
+                        type(current_value).__name__,
+                    )
+                    _LOGGER.debug(
+                        "Available energy-related keys in coordinator data: %s",
+                        [k for k in data if "energy" in k.lower()],
+                    )
 
                 if current_value is not None and current_value > 0:
                     # Update the cumulative value (accumulate discharging energy)
@@ -524,198 +650,47 @@ class SAXBatterySensor(CoordinatorEntity, SensorEntity):
         self._data_key = data_key
         self._battery_name = battery_name
 
-        # Use battery-specific name if provided
-        if battery_name:
-            # Remove battery prefix (battery_a_, battery_b_, etc.) from data key
-            sensor_key = data_key
-            for prefix in ["battery_a_", "battery_b_", "battery_c_"]:
-                if data_key.startswith(prefix):
-                    sensor_key = data_key.replace(prefix, "")
-                    break
-
-            sensor_base_name = self._get_sensor_name(sensor_key)
-            # Create entity name in format: SAX Battery A Sensor Name
-            battery_letter = battery_name.split()[-1].upper()
-            self._attr_name = f"Sax Battery {battery_letter} {sensor_base_name}"
-            # Update unique_id to match the naming pattern you want: sax_battery_a_sensor_key
-            self._attr_unique_id = (
-                f"{DOMAIN}_battery_{battery_letter.lower()}_{sensor_key}"
-            )
-        else:
-            self._attr_name = self._get_sensor_name(data_key)
-            self._attr_unique_id = f"{DOMAIN}_{data_key}"
+        self._attr_unique_id, self._attr_name = build_sensor_names(
+            data_key, battery_name
+        )
 
         self._attr_device_class, self._attr_native_unit_of_measurement = (
             self._get_device_class_and_unit(data_key)
         )
         self._attr_state_class = self._get_state_class(data_key)
 
-        # Add device info - use coordinator device_id for consistency
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.device_id)},
-            "name": "SAX Battery System",
-            "manufacturer": "SAX",
-            "model": "SAX Battery",
-            "sw_version": "1.0",
-        }
-
-    def _get_sensor_name(self, key: str) -> str:
-        """Get human-readable sensor name."""
-        name_mapping = {
-            "soc": "SOC",
-            "power": "Power",
-            "smartmeter": "Smart Meter",
-            "capacity": "Capacity",
-            "cycles": "Cycles",
-            "temp": "Temperature",
-            "energy_produced": "Energy Produced",
-            "energy_consumed": "Energy Consumed",
-            "voltage_l1": "Voltage L1",
-            "voltage_l2": "Voltage L2",
-            "voltage_l3": "Voltage L3",
-            "current_l1": "Current L1",
-            "current_l2": "Current L2",
-            "current_l3": "Current L3",
-            "grid_frequency": "Grid Frequency",
-            "active_power_l1": "Active Power L1",
-            "active_power_l2": "Active Power L2",
-            "active_power_l3": "Active Power L3",
-            "apparent_power": "Apparent Power",
-            "reactive_power": "Reactive Power",
-            "power_factor": "Power Factor",
-            "phase_currents_sum": "Phase Currents Sum",
-            "ac_power_total": "AC Power Total",
-            "storage_status": "Storage Status",
-            "smartmeter_voltage_l1": "Smart Meter Voltage L1",
-            "smartmeter_voltage_l2": "Smart Meter Voltage L2",
-            "smartmeter_voltage_l3": "Smart Meter Voltage L3",
-            "smartmeter_current_l1": "Smart Meter Current L1",
-            "smartmeter_current_l2": "Smart Meter Current L2",
-            "smartmeter_current_l3": "Smart Meter Current L3",
-            "smartmeter_total_power": "Smart Meter Total Power",
-        }
-        return name_mapping.get(key, key.replace("_", " ").title())
+        # Add device info
+        self._attr_device_info = coordinator.device_info
 
     def _get_device_class_and_unit(
         self, key: str
     ) -> tuple[SensorDeviceClass | None, str | None]:
         """Get device class and unit for sensor."""
-        # Remove battery prefix for lookup
-        lookup_key = key
-        for prefix in ["battery_a_", "battery_b_", "battery_c_"]:
-            if key.startswith(prefix):
-                lookup_key = key.replace(prefix, "")
-                break
-
-        mapping = {
-            "soc": (SensorDeviceClass.BATTERY, PERCENTAGE),
-            "power": (SensorDeviceClass.POWER, UnitOfPower.WATT),
-            "capacity": (SensorDeviceClass.ENERGY, UnitOfEnergy.WATT_HOUR),
-            "temp": (SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS),
-            "energy_produced": (SensorDeviceClass.ENERGY, UnitOfEnergy.KILO_WATT_HOUR),
-            "energy_consumed": (SensorDeviceClass.ENERGY, UnitOfEnergy.KILO_WATT_HOUR),
-            "voltage_l1": (SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT),
-            "voltage_l2": (SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT),
-            "voltage_l3": (SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT),
-            "current_l1": (SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE),
-            "current_l2": (SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE),
-            "current_l3": (SensorDeviceClass.CURRENT, UnitOfElectricCurrent.AMPERE),
-            "grid_frequency": (SensorDeviceClass.FREQUENCY, UnitOfFrequency.HERTZ),
-            "active_power_l1": (SensorDeviceClass.POWER, UnitOfPower.WATT),
-            "active_power_l2": (SensorDeviceClass.POWER, UnitOfPower.WATT),
-            "active_power_l3": (SensorDeviceClass.POWER, UnitOfPower.WATT),
-            "apparent_power": (SensorDeviceClass.APPARENT_POWER, "VA"),
-            "reactive_power": (
-                SensorDeviceClass.REACTIVE_POWER,
-                "var",
-            ),  # Fixed: was "VAR"
-            "power_factor": (SensorDeviceClass.POWER_FACTOR, PERCENTAGE),
-            "phase_currents_sum": (
-                SensorDeviceClass.CURRENT,
-                UnitOfElectricCurrent.AMPERE,
-            ),
-            "ac_power_total": (SensorDeviceClass.POWER, UnitOfPower.WATT),
-            "smartmeter_voltage_l1": (
-                SensorDeviceClass.VOLTAGE,
-                UnitOfElectricPotential.VOLT,
-            ),
-            "smartmeter_voltage_l2": (
-                SensorDeviceClass.VOLTAGE,
-                UnitOfElectricPotential.VOLT,
-            ),
-            "smartmeter_voltage_l3": (
-                SensorDeviceClass.VOLTAGE,
-                UnitOfElectricPotential.VOLT,
-            ),
-            "smartmeter_current_l1": (
-                SensorDeviceClass.CURRENT,
-                UnitOfElectricCurrent.AMPERE,
-            ),
-            "smartmeter_current_l2": (
-                SensorDeviceClass.CURRENT,
-                UnitOfElectricCurrent.AMPERE,
-            ),
-            "smartmeter_current_l3": (
-                SensorDeviceClass.CURRENT,
-                UnitOfElectricCurrent.AMPERE,
-            ),
-            "smartmeter_total_power": (SensorDeviceClass.POWER, UnitOfPower.WATT),
-        }
-        return mapping.get(lookup_key, (None, None))
+        return SENSOR_DEVICE_CLASSES_AND_UNITS.get(
+            strip_battery_prefix(key), (None, None)
+        )
 
     def _get_state_class(self, key: str) -> SensorStateClass | None:
         """Get state class for sensor."""
-        # Remove battery prefix for lookup
-        lookup_key = key
-        for prefix in ["battery_a_", "battery_b_", "battery_c_"]:
-            if key.startswith(prefix):
-                lookup_key = key.replace(prefix, "")
-                break
-
-        if lookup_key in ["energy_produced", "energy_consumed", "cycles"]:
+        lookup_key = strip_battery_prefix(key)
+        if lookup_key in TOTAL_INCREASING_SENSOR_KEYS:
             return SensorStateClass.TOTAL_INCREASING
         if lookup_key == "capacity":  # Capacity should be TOTAL, not MEASUREMENT
             return SensorStateClass.TOTAL
-        if lookup_key in [
-            "soc",
-            "power",
-            "temp",
-            "voltage_l1",
-            "voltage_l2",
-            "voltage_l3",
-            "current_l1",
-            "current_l2",
-            "current_l3",
-            "grid_frequency",
-            "active_power_l1",
-            "active_power_l2",
-            "active_power_l3",
-            "apparent_power",
-            "reactive_power",
-            "power_factor",  # Added missing power_factor
-            "phase_currents_sum",
-            "ac_power_total",
-            "smartmeter_voltage_l1",
-            "smartmeter_voltage_l2",
-            "smartmeter_voltage_l3",
-            "smartmeter_current_l1",
-            "smartmeter_current_l2",
-            "smartmeter_current_l3",
-            "smartmeter_total_power",
-        ]:
+        if lookup_key in MEASUREMENT_SENSOR_KEYS:
             return SensorStateClass.MEASUREMENT
         return None
 
     @property
     def native_value(self) -> Any:
         """Return the value of the sensor."""
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data.get(self._data_key)
+        data = self.coordinator.data
+        return data.get(self._data_key) if data else None
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self.coordinator.last_update_success and self._data_key in (
-            self.coordinator.data or {}
+        data = self.coordinator.data
+        return bool(
+            self.coordinator.last_update_success and data and self._data_key in data
         )
@@ -29,46 +29,11 @@ async def async_setup_entry(
         SAXBatteryManualControlSwitch(coordinator),
     ]
 
-    # Add individual battery on/off switches
-    # Access battery objects directly from coordinator's battery attributes
-    for battery_id in coordinator.batteries:
-        # Try different ways to access the battery object
-        battery = None
-
-        # Method 1: Try as direct attribute (most likely)
-        if hasattr(coordinator, battery_id):
-            battery = getattr(coordinator, battery_id)
-
-        # Method 2: Try from a batteries collection/dict
-        if battery is None and hasattr(coordinator, "battery_objects"):
-            battery = coordinator.battery_objects.get(battery_id)
-
-        # Method 3: Try accessing from master battery's data manager
-        if battery is None and hasattr(coordinator, "master_battery"):
-            master_battery = coordinator.master_battery
-            if hasattr(master_battery, "_data_manager"):
-                # Check if the battery objects are stored in the data manager
-                if hasattr(master_battery._data_manager, "batteries"):  # noqa: SLF001
-                    battery = master_battery._data_manager.batteries.get(battery_id)  # noqa: SLF001
-
-        if battery is not None:
-            entities.append(SAXBatteryOnOffSwitch(battery_id, battery, coordinator))
-        else:
-            _LOGGER.warning("Battery object not found for ID: %s", battery_id)
-            # Add debug info to help understand the coordinator structure
-            _LOGGER.debug(
-                "Coordinator attributes: %s",
-                [attr for attr in dir(coordinator) if not attr.startswith("_")],
-            )
-            if hasattr(coordinator, "master_battery"):
-                _LOGGER.debug(
-                    "Master battery attributes: %s",
-                    [
-                        attr
-                        for attr in dir(coordinator.master_battery)
-                        if not attr.startswith("_")
-                    ],
-                )
+    # Add individual battery on/off switches, one per configured battery
+    entities.extend(
+        SAXBatteryOnOffSwitch(battery_id, battery, coordinator)
+        for battery_id, battery in coordinator.batteries.items()
+    )
 
     async_add_entities(entities)
 
@@ -76,21 +41,16 @@ async def async_setup_entry(
 class SAXBatterySolarChargingSwitch(CoordinatorEntity, SwitchEntity):
     """Switch to enable/disable solar charging."""
 
+    _attr_name = "Sax Battery Solar Charging"
+    _attr_unique_id = f"{DOMAIN}_solar_charging"
+    _attr_icon = "mdi:solar-power"
+
     def __init__(self, coordinator: SAXBatteryCoordinator) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
-        self._attr_name = "Sax Battery Solar Charging"
-        self._attr_unique_id = f"{DOMAIN}_solar_charging"
-        self._attr_icon = "mdi:solar-power"
 
         # Add device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.device_id)},
-            "name": "SAX Battery System",
-            "manufacturer": "SAX",
-            "model": "SAX Battery",
-            "sw_version": "1.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
@@ -115,14 +75,13 @@ class SAXBatterySolarChargingSwitch(CoordinatorEntity, SwitchEntity):
         )
 
         # Update pilot mode
-        sax_data = self.hass.data[DOMAIN][self.coordinator.config_entry.entry_id]
-        if hasattr(sax_data, "pilot") and sax_data.pilot:
-            await sax_data.pilot.set_solar_charging(solar_charging)
+        if pilot := getattr(self.coordinator, "pilot", None):
+            await pilot.set_solar_charging(solar_charging)
 
-        # Force immediate state updates
-        self.async_schedule_update_ha_state(force_refresh=True)
+        # The state comes from the config entry, so it can be written right away
+        self.async_write_ha_state()
 
-        # Trigger coordinator refresh
+        # Only schedules the debounced refresh, so it doesn't block the call
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
@@ -136,9 +95,8 @@ class SAXBatterySolarChargingSwitch(CoordinatorEntity, SwitchEntity):
         )
 
         # Update pilot mode
-        sax_data = self.hass.data[DOMAIN][self.coordinator.config_entry.entry_id]
-        if hasattr(sax_data, "pilot") and sax_data.pilot:
-            await sax_data.pilot.set_solar_charging(False)
+        if pilot := getattr(self.coordinator, "pilot", None):
+            await pilot.set_solar_charging(False)
 
         self.async_write_ha_state()
 
@@ -146,21 +104,16 @@ class SAXBatterySolarChargingSwitch(CoordinatorEntity, SwitchEntity):
 class SAXBatteryManualControlSwitch(CoordinatorEntity, SwitchEntity):
     """Switch to enable/disable manual control mode."""
 
+    _attr_name = "Sax Battery Manual Control"
+    _attr_unique_id = f"{DOMAIN}_manual_control"
+    _attr_icon = "mdi:hand-back-right"
+
     def __init__(self, coordinator: SAXBatteryCoordinator) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
-        self._attr_name = "Sax Battery Manual Control"
-        self._attr_unique_id = f"{DOMAIN}_manual_control"
-        self._attr_icon = "mdi:hand-back-right"
 
         # Add device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.device_id)},
-            "name": "SAX Battery System",
-            "manufacturer": "SAX",
-            "model": "SAX Battery",
-            "sw_version": "1.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
@@ -185,14 +138,13 @@ class SAXBatteryManualControlSwitch(CoordinatorEntity, SwitchEntity):
         )
 
         # Update pilot mode
-        sax_data = self.hass.data[DOMAIN][self.coordinator.config_entry.entry_id]
-        if hasattr(sax_data, "pilot") and sax_data.pilot:
-            await sax_data.pilot.set_solar_charging(solar_charging)
+        if pilot := getattr(self.coordinator, "pilot", None):
+            await pilot.set_solar_charging(solar_charging)
 
-        # Force immediate state updates
-        self.async_schedule_update_ha_state(force_refresh=True)
+        # The state comes from the config entry, so it can be written right away
+        self.async_write_ha_state()
 
-        # Trigger coordinator refresh
+        # Only schedules the debounced refresh, so it doesn't block the call
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
@@ -206,9 +158,8 @@ class SAXBatteryManualControlSwitch(CoordinatorEntity, SwitchEntity):
         )
 
         # Force pilot back to automatic mode
-        sax_data = self.hass.data[DOMAIN][self.coordinator.config_entry.entry_id]
-        if hasattr(sax_data, "pilot") and sax_data.pilot:
-            await sax_data.pilot._async_update_pilot()  # noqa: SLF001
+        if pilot := getattr(self.coordinator, "pilot", None):
+            await pilot._async_update_pilot()  # noqa: SLF001
 
         self.async_write_ha_state()
 
@@ -235,59 +186,61 @@ class SAXBatteryOnOffSwitch(CoordinatorEntity, SwitchEntity):
             _LOGGER.error("Cannot access modbus registers for battery %s", battery_id)
             self._registers = {}
 
+        # Status key patterns to try, in order of preference
+        self._status_keys = (
+            f"{battery_id}_status",
+            f"{battery_id}_{SAX_STATUS}",
+            f"{battery_id}_sax_status",
+            SAX_STATUS,
+        )
+
+        # Resolve the register config once, it is static
+        self._state_on = self._registers.get("state_on", 3)
+        self._state_off = self._registers.get("state_off", 1)
+        self._address = self._registers.get("address", 45)
+        self._device_id = self._registers.get("slave", 64)
+        self._command_on = self._registers.get("command_on", 2)
+        self._command_off = self._registers.get("command_off", 1)
+
         # Add device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.device_id)},
-            "name": "SAX Battery System",
-            "manufacturer": "SAX",
-            "model": "SAX Battery",
-            "sw_version": "1.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
         """Return True if the switch is on."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
 
-        # Try different status key patterns based on your data structure
-        status_keys = [
-            f"{self.battery_id}_status",
-            f"{self.battery_id}_{SAX_STATUS}",
-            f"{self.battery_id}_sax_status",
-            SAX_STATUS,
-        ]
-
-        for status_key in status_keys:
-            if status_key in self.coordinator.data:
-                status_value = self.coordinator.data[status_key]
-                if status_value is None:
-                    continue
-
+        for status_key in self._status_keys:
+            status_value = data.get(status_key)
+            if status_value is not None:
                 # Log the actual status value for debugging
-                _LOGGER.debug(
-                    "Battery %s status key '%s' has value: %s (type: %s)",
-                    self.battery_id,
-                    status_key,
-                    status_value,
-                    type(status_value),
-                )
+                debug = _LOGGER.isEnabledFor(logging.DEBUG)
+                if debug:
+                    _LOGGER.debug(
+                        "Battery %s status key '%s' has value: %s (type: %s)",
+                        self.battery_id,
+                        status_key,
+                        status_value,
+                        type(status_value),
+                    )
 
                 # Match against configured on/off states from registers
                 if self._registers:
-                    state_on = self._registers.get("state_on", 3)
-                    state_off = self._registers.get("state_off", 1)
+                    state_on = self._state_on
 
                     if isinstance(status_value, (int, float)):
                         is_on = int(status_value) == state_on
-                        _LOGGER.debug(
-                            "Battery %s status %s compared to on=%s, off=%s -> is_on=%s",
-                            self.battery_id,
-                            status_value,
-                            state_on,
-                            state_off,
-                            is_on,
-                        )
+                        if debug:
+                            _LOGGER.debug(
+                                "Battery %s status %s compared to on=%s, off=%s -> is_on=%s",
+                                self.battery_id,
+                                status_value,
+                                state_on,
+                                self._state_off,
+                                is_on,
+                            )
                         return is_on
                     if isinstance(status_value, dict):
                         # If status is a dict, look for relevant keys
@@ -313,22 +266,12 @@ class SAXBatteryOnOffSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
 
         # Check if any status key exists and has non-None value
-        status_keys = [
-            f"{self.battery_id}_status",
-            f"{self.battery_id}_{SAX_STATUS}",
-            f"{self.battery_id}_sax_status",
-            SAX_STATUS,
-        ]
-
-        return any(
-            status_key in self.coordinator.data
-            and self.coordinator.data[status_key] is not None
-            for status_key in status_keys
-        )
+        return any(data.get(status_key) is not None for status_key in self._status_keys)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
@@ -339,10 +282,10 @@ class SAXBatteryOnOffSwitch(CoordinatorEntity, SwitchEntity):
             return
 
         try:
-            slave_id = self._registers.get("slave", 64)
-            command_on = self._registers.get("command_on", 2)
-            address = self._registers.get("address", 45)
-            expected_state = self._registers.get("state_on", 3)
+            slave_id = self._device_id
+            command_on = self._command_on
+            address = self._address
+            expected_state = self._state_on
 
             _LOGGER.debug(
                 "Turning ON battery %s - Writing %s to register %s with device_id %s",
@@ -390,10 +333,10 @@ class SAXBatteryOnOffSwitch(CoordinatorEntity, SwitchEntity):
             return
 
         try:
-            slave_id = self._registers.get("slave", 64)
-            command_off = self._registers.get("command_off", 1)
-            address = self._registers.get("address", 45)
-            expected_state = self._registers.get("state_off", 1)
+            slave_id = self._device_id
+            command_off = self._command_off
+            address = self._address
+            expected_state = self._state_off
 
             _LOGGER.debug(
                 "Turning OFF battery %s - Writing %s to register %s with device_id %s",
@@ -442,9 +385,9 @@ class SAXBatteryOnOffSwitch(CoordinatorEntity, SwitchEntity):
         log_interval = 30  # Log progress every 30 seconds
 
         while (elapsed := asyncio.get_event_loop().time() - start_time) < timeout:
-            # Refresh coordinator data
-            await self.coordinator.async_request_refresh()
-            await asyncio.sleep(2)  # Give coordinator time to update
+            # Read the status now, a requested refresh is debounced and would
+            # only show up after this check
+            await self.coordinator.async_refresh()
 
             # Check current status
             current_status = self._get_current_status()
@@ -489,25 +432,18 @@ class SAXBatteryOnOffSwitch(CoordinatorEntity, SwitchEntity):
 
     def _get_current_status(self) -> int | None:
         """Get current battery status value."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
 
-        status_keys = [
-            f"{self.battery_id}_status",
-            f"{self.battery_id}_{SAX_STATUS}",
-            f"{self.battery_id}_sax_status",
-            SAX_STATUS,
-        ]
-
-        for status_key in status_keys:
-            if status_key in self.coordinator.data:
-                status_value = self.coordinator.data[status_key]
-                if status_value is not None:
-                    if isinstance(status_value, (int, float)):
-                        return int(status_value)
-                    if isinstance(status_value, dict):
-                        if "state" in status_value:
-                            return int(status_value["state"])
-                        if "status" in status_value:
-                            return int(status_value["status"])
+        for status_key in self._status_keys:
+            status_value = data.get(status_key)
+            if status_value is not None:
+                if isinstance(status_value, (int, float)):
+                    return int(status_value)
+                if isinstance(status_value, dict):
+                    if "state" in status_value:
+                        return int(status_value["state"])
+                    if "status" in status_value:
+                        return int(status_value["status"])
         return None
@@ -1,4 +1,5 @@
 #!/usr/bin/env bash
 source "$VIRTUAL_ENV/bin/activate"
 
-pytest tests
+# Spread the tests over all cores, keeping each module/class on one worker
+pytest tests -n auto --dist=loadscope "$@"
@@ -1,11 +1,11 @@
 """Tests for the SAX Battery config flow."""
 
-from unittest.mock import patch
+import functools
+from types import MappingProxyType
 
 import pytest
-import voluptuous as vol
 
-from custom_components.sax_battery.config_flow import SAXBatteryConfigFlow
+from custom_components.sax_battery.config_flow import USER_SCHEMA, SAXBatteryConfigFlow
 
 # filepath: custom_components/sax_battery/test_config_flow.py
 from custom_components.sax_battery.const import (
@@ -25,16 +25,30 @@ from custom_components.sax_battery.const import (
     DEFAULT_PORT,
 )
 
+# Read-only so a flow step can never mutate it between tests
+VALID_PILOT_OPTIONS = MappingProxyType(
+    {
+        CONF_MIN_SOC: DEFAULT_MIN_SOC,
+        CONF_AUTO_PILOT_INTERVAL: DEFAULT_AUTO_PILOT_INTERVAL,
+        CONF_ENABLE_SOLAR_CHARGING: True,
+    }
+)
+
 
-@pytest.fixture(name="mock_entity_selector")
-def mock_entity_selector_fixture():
-    """Mock the entity selector."""
-    with patch("homeassistant.helpers.selector.EntitySelector") as mock:
-        yield mock
+@functools.lru_cache(maxsize=8)
+def battery_hosts(battery_count, master):
+    """Return read-only battery config input for the given battery count."""
+    hosts = {}
+    for i in range(battery_count):
+        battery_id = f"battery_{chr(97 + i)}"
+        hosts[f"{battery_id}_host"] = f"192.168.1.{10 + i}"
+        hosts[f"{battery_id}_port"] = DEFAULT_PORT
+    hosts[CONF_MASTER_BATTERY] = master
+    return MappingProxyType(hosts)
 
 
 @pytest.fixture(name="config_flow")
-def config_flow_fixture(hass):
+def config_flow_fixture():
     """Create a config flow instance."""
     return SAXBatteryConfigFlow()
 
@@ -50,12 +64,13 @@ class TestSAXBatteryConfigFlow:
         config_flow._pilot_from_ha = True
         return config_flow
 
-    async def test_user_step(self, hass, config_flow, mock_entity_selector):
+    async def test_user_step(self, config_flow):
         """Test the user step."""
         # Test initial form
         result = await config_flow.async_step_user()
         assert result["type"] == "form"
         assert result["step_id"] == "user"
+        assert result["data_schema"] is USER_SCHEMA
 
         # Test with valid input
         result = await config_flow.async_step_user({CONF_BATTERY_COUNT: 2})
@@ -64,7 +79,7 @@ class TestSAXBatteryConfigFlow:
         assert config_flow._battery_count == 2
         assert config_flow._data[CONF_DEVICE_ID] is not None
 
-    async def test_control_options_step(self, hass, config_flow, mock_entity_selector):
+    async def test_control_options_step(self, config_flow):
         """Test the control options step."""
         config_flow._battery_count = 2
 
@@ -94,142 +109,50 @@ class TestPilotOptionsFlow:
         config_flow._data = {}
         return config_flow
 
-    async def test_valid_input(self, hass, config_flow, mock_entity_selector):
+    async def test_valid_input(self, config_flow):
         """Test pilot options with valid input."""
-        user_input = {
-            CONF_MIN_SOC: DEFAULT_MIN_SOC,
-            CONF_AUTO_PILOT_INTERVAL: DEFAULT_AUTO_PILOT_INTERVAL,
-            CONF_ENABLE_SOLAR_CHARGING: True,
-        }
-        result = await config_flow.async_step_pilot_options(user_input)
+        result = await config_flow.async_step_pilot_options(VALID_PILOT_OPTIONS)
         assert result["type"] == "form"
         assert result["step_id"] == "sensors"
 
-    async def test_pilot_options_invalid_values(self, hass, config_flow):
-        """Test pilot options with invalid values."""
-        config_flow._battery_count = 1
-        config_flow._data = {}
-
-        # Test with invalid AUTO_PILOT_INTERVAL
+    @pytest.mark.parametrize(
+        ("min_soc", "expected_errors"),
+        [
+            ("invalid", {CONF_MIN_SOC: "invalid_min_soc"}),
+            (101, {CONF_MIN_SOC: "invalid_min_soc"}),
+            (-1, {CONF_MIN_SOC: "invalid_min_soc"}),
+        ],
+    )
+    async def test_pilot_options_invalid_min_soc(
+        self, config_flow, min_soc, expected_errors
+    ):
+        """Test pilot options with an invalid or out of range minimum SOC."""
+        user_input = {**VALID_PILOT_OPTIONS, CONF_MIN_SOC: min_soc}
+        result = await config_flow.async_step_pilot_options(user_input)
+        assert result["type"] == "form"
+        assert result["step_id"] == "pilot_options"
+        assert result["errors"] == expected_errors
+
+    @pytest.mark.parametrize(
+        ("auto_pilot_interval", "expected_errors"),
+        [
+            ("invalid", {CONF_AUTO_PILOT_INTERVAL: "invalid_interval"}),
+            (4, {CONF_AUTO_PILOT_INTERVAL: "invalid_interval"}),
+            (301, {CONF_AUTO_PILOT_INTERVAL: "invalid_interval"}),
+        ],
+    )
+    async def test_pilot_options_invalid_interval(
+        self, config_flow, auto_pilot_interval, expected_errors
+    ):
+        """Test pilot options with an invalid or out of range interval."""
         user_input = {
-            CONF_MIN_SOC: DEFAULT_MIN_SOC,
-            CONF_AUTO_PILOT_INTERVAL: "invalid",
-            CONF_ENABLE_SOLAR_CHARGING: True,
+            **VALID_PILOT_OPTIONS,
+            CONF_AUTO_PILOT_INTERVAL: auto_pilot_interval,
         }
         result = await config_flow.async_step_pilot_options(user_input)
         assert result["type"] == "form"
         assert result["step_id"] == "pilot_options"
-        assert result["errors"][CONF_AUTO_PILOT_INTERVAL] == "invalid_interval"
-
-    async def test_pilot_options_voluptuous_invalid(self, hass, config_flow):
-        """Test pilot options with input that triggers voluptuous.Invalid."""
-        config_flow._battery_count = 1
-        config_flow._data = {}
-
-        with patch("voluptuous.Schema.__call__", side_effect=vol.Invalid("test error")):
-            user_input = {
-                CONF_MIN_SOC: DEFAULT_MIN_SOC,
-                CONF_AUTO_PILOT_INTERVAL: DEFAULT_AUTO_PILOT_INTERVAL,
-                CONF_ENABLE_SOLAR_CHARGING: True,
-            }
-            result = await config_flow.async_step_pilot_options(user_input)
-            assert result["type"] == "form"
-            assert result["step_id"] == "pilot_options"
-            assert result["errors"]["base"] == "invalid_pilot_options"
-
-    async def test_pilot_options_validation_errors(self, hass, config_flow):
-        """Test pilot options with various validation errors."""
-        test_cases = [
-            (
-                {
-                    CONF_MIN_SOC: "invalid",
-                    CONF_AUTO_PILOT_INTERVAL: DEFAULT_AUTO_PILOT_INTERVAL,
-                    CONF_ENABLE_SOLAR_CHARGING: True,
-                },
-                "invalid_min_soc",
-            ),
-            (
-                {
-                    CONF_MIN_SOC: DEFAULT_MIN_SOC,
-                    CONF_AUTO_PILOT_INTERVAL: "invalid",
-                    CONF_ENABLE_SOLAR_CHARGING: True,
-                },
-                "invalid_interval",
-            ),
-            (
-                {
-                    CONF_MIN_SOC: 101,  # Above max
-                    CONF_AUTO_PILOT_INTERVAL: DEFAULT_AUTO_PILOT_INTERVAL,
-                    CONF_ENABLE_SOLAR_CHARGING: True,
-                },
-                "invalid_min_soc",
-            ),
-            (
-                {
-                    CONF_MIN_SOC: DEFAULT_MIN_SOC,
-                    CONF_AUTO_PILOT_INTERVAL: 4,  # Below min
-                    CONF_ENABLE_SOLAR_CHARGING: True,
-                },
-                "invalid_interval",
-            ),
-        ]
-
-        for user_input, expected_error in test_cases:
-            result = await config_flow.async_step_pilot_options(user_input)
-            assert result["type"] == "form"
-            assert result["step_id"] == "pilot_options"
-            assert any(expected_error in error for error in result["errors"].values())
-
-    async def test_pilot_options_invalid_input(self, hass, config_flow):
-        """Test pilot options with invalid inputs."""
-        config_flow._battery_count = 1
-        config_flow._data = {}
-
-        test_cases = [
-            # Test MIN_SOC validation
-            {
-                CONF_MIN_SOC: 101,  # Too high
-                CONF_AUTO_PILOT_INTERVAL: DEFAULT_AUTO_PILOT_INTERVAL,
-                CONF_ENABLE_SOLAR_CHARGING: True,
-            },
-            {
-                CONF_MIN_SOC: -1,  # Too low
-                CONF_AUTO_PILOT_INTERVAL: DEFAULT_AUTO_PILOT_INTERVAL,
-                CONF_ENABLE_SOLAR_CHARGING: True,
-            },
-            {
-                CONF_MIN_SOC: "invalid",  # Invalid type
-                CONF_AUTO_PILOT_INTERVAL: DEFAULT_AUTO_PILOT_INTERVAL,
-                CONF_ENABLE_SOLAR_CHARGING: True,
-            },
-            # Test AUTO_PILOT_INTERVAL validation
-            {
-                CONF_MIN_SOC: DEFAULT_MIN_SOC,
-                CONF_AUTO_PILOT_INTERVAL: 4,  # Too low
-                CONF_ENABLE_SOLAR_CHARGING: True,
-            },
-            {
-                CONF_MIN_SOC: DEFAULT_MIN_SOC,
-                CONF_AUTO_PILOT_INTERVAL: 301,  # Too high
-                CONF_ENABLE_SOLAR_CHARGING: True,
-            },
-            {
-                CONF_MIN_SOC: DEFAULT_MIN_SOC,
-                CONF_AUTO_PILOT_INTERVAL: "invalid",  # Invalid type
-                CONF_ENABLE_SOLAR_CHARGING: True,
-            },
-        ]
-
-        for user_input in test_cases:
-            result = await config_flow.async_step_pilot_options(user_input)
-            assert result["type"] == "form"
-            assert result["step_id"] == "pilot_options"
-            assert len(result["errors"]) > 0
-            # Verify either MIN_SOC or AUTO_PILOT_INTERVAL has an error
-            assert any(
-                key in result["errors"]
-                for key in [CONF_MIN_SOC, CONF_AUTO_PILOT_INTERVAL]
-            )
+        assert result["errors"] == expected_errors
 
 
 class TestSensorsFlow:
@@ -242,9 +165,7 @@ class TestSensorsFlow:
         config_flow._pilot_from_ha = True
         return config_flow
 
-    async def test_sensors_with_pilot_from_ha(
-        self, hass, config_flow, mock_entity_selector
-    ):
+    async def test_sensors_with_pilot_from_ha(self, config_flow):
         """Test sensors step with pilot from HA enabled."""
         result = await config_flow.async_step_sensors()
         assert result["type"] == "form"
@@ -260,28 +181,13 @@ class TestSensorsFlow:
         assert config_flow._data[CONF_POWER_SENSOR] == "sensor.power"
         assert config_flow._data[CONF_PF_SENSOR] == "sensor.pf"
 
-    async def test_sensors_without_pilot_from_ha(
-        self, hass, config_flow, mock_entity_selector
-    ):
+    async def test_sensors_without_pilot_from_ha(self, config_flow):
         """Test sensors step with pilot from HA disabled."""
         config_flow._pilot_from_ha = False
         result = await config_flow.async_step_sensors()
         assert result["type"] == "form"
         assert result["step_id"] == "battery_config"
 
-    async def test_sensors_step_skip_when_not_pilot_from_ha(self, hass, config_flow):
-        """Test that sensors step is skipped when not piloting from HA."""
-        # Set pilot_from_ha to False
-        config_flow._pilot_from_ha = False
-        config_flow._data = {}
-
-        # Call async_step_sensors without user_input
-        result = await config_flow.async_step_sensors()
-
-        # Verify it skips to battery config
-        assert result["type"] == "form"
-        assert result["step_id"] == "battery_config"
-
 
 class TestPriorityDevicesFlow:
     """Test the priority devices configuration flow."""
@@ -292,9 +198,7 @@ class TestPriorityDevicesFlow:
         config_flow._data = {}
         return config_flow
 
-    async def test_priority_devices_with_devices(
-        self, hass, config_flow, mock_entity_selector
-    ):
+    async def test_priority_devices_with_devices(self, config_flow):
         """Test priority devices step with devices selected."""
         result = await config_flow.async_step_priority_devices()
         assert result["type"] == "form"
@@ -309,9 +213,7 @@ class TestPriorityDevicesFlow:
             "sensor.device2",
         ]
 
-    async def test_priority_devices_without_devices(
-        self, hass, config_flow, mock_entity_selector
-    ):
+    async def test_priority_devices_without_devices(self, config_flow):
         """Test priority devices step with no devices selected."""
         user_input = {CONF_PRIORITY_DEVICES: []}
         result = await config_flow.async_step_priority_devices(user_input)
@@ -336,12 +238,9 @@ class TestBatteryConfigFlow:
         assert result["type"] == "form"
         assert result["step_id"] == "battery_config"
 
-        user_input = {
-            "battery_a_host": "192.168.1.10",
-            "battery_a_port": DEFAULT_PORT,
-            CONF_MASTER_BATTERY: "battery_a",
-        }
-        result = await config_flow.async_step_battery_config(user_input)
+        result = await config_flow.async_step_battery_config(
+            battery_hosts(1, "battery_a")
+        )
         assert result["type"] == "create_entry"
         assert result["title"] == "SAX Battery"
         assert result["data"][CONF_MASTER_BATTERY] == "battery_a"
@@ -352,19 +251,23 @@ class TestBatteryConfigFlow:
         assert result["type"] == "form"
         assert result["step_id"] == "battery_config"
 
-        user_input = {
-            "battery_a_host": "192.168.1.10",
-            "battery_a_port": DEFAULT_PORT,
-            "battery_b_host": "192.168.1.11",
-            "battery_b_port": DEFAULT_PORT,
-            CONF_MASTER_BATTERY: "battery_a",
-        }
-        result = await config_flow.async_step_battery_config(user_input)
+        result = await config_flow.async_step_battery_config(
+            battery_hosts(2, "battery_a")
+        )
         assert result["type"] == "create_entry"
         assert result["title"] == "SAX Battery"
         assert result["data"][CONF_MASTER_BATTERY] == "battery_a"
 
-    async def test_battery_config_none_battery_count(self, hass, config_flow):
+    async def test_battery_config_schema_cached(self, config_flow):
+        """Test the battery config schema is built once per battery count."""
+        first = await config_flow.async_step_battery_config()
+        second = await config_flow.async_step_battery_config()
+        assert first["data_schema"] is second["data_schema"]
+
+        schema_keys = {str(key) for key in first["data_schema"].schema}
+        assert schema_keys == set(battery_hosts(2, "battery_a"))
+
+    async def test_battery_config_none_battery_count(self, config_flow):
         """Test battery configuration with None battery count."""
         config_flow._battery_count = None
         result = await config_flow.async_step_battery_config()
@@ -372,8 +275,41 @@ class TestBatteryConfigFlow:
         assert result["step_id"] == "battery_config"
 
 
-@pytest.mark.asyncio
-async def test_config_flow_initialization():
+async def run_flow_steps(flow, steps):
+    """Submit user input to each flow step in order and return the last result."""
+    result = None
+    for step_id, user_input in steps:
+        result = await getattr(flow, f"async_step_{step_id}")(user_input)
+    return result
+
+
+async def test_full_flow_with_pilot(hass, config_flow):
+    """Test the complete user flow with piloting from HA enabled."""
+    result = await run_flow_steps(
+        config_flow,
+        [
+            ("user", {CONF_BATTERY_COUNT: 2}),
+            ("control_options", {CONF_PILOT_FROM_HA: True, CONF_LIMIT_POWER: False}),
+            ("pilot_options", VALID_PILOT_OPTIONS),
+            (
+                "sensors",
+                {CONF_POWER_SENSOR: "sensor.power", CONF_PF_SENSOR: "sensor.pf"},
+            ),
+            ("priority_devices", {CONF_PRIORITY_DEVICES: []}),
+            ("battery_config", battery_hosts(2, "battery_b")),
+        ],
+    )
+
+    # Only the final result matters, the intermediate forms are covered above
+    assert result["type"] == "create_entry"
+    assert result["data"][CONF_BATTERY_COUNT] == 2
+    assert result["data"][CONF_PILOT_FROM_HA] is True
+    assert result["data"][CONF_POWER_SENSOR] == "sensor.power"
+    assert result["data"][CONF_MASTER_BATTERY] == "battery_b"
+    assert result["data"][CONF_DEVICE_ID] is not None
+
+
+def test_config_flow_initialization():
     """Test ConfigFlow initialization and attribute access."""
     flow = SAXBatteryConfigFlow()
     # Force attribute access to ensure coverage
@@ -0,0 +1,181 @@
+"""Tests for the SAX Battery data update coordinator."""
+
+import asyncio
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.sax_battery.const import CONF_DEVICE_ID, DOMAIN
+from custom_components.sax_battery.coordinator import (
+    BATTERY_REGISTERS,
+    SAXBatteryCoordinator,
+)
+from custom_components.sax_battery.hub import HubConnectionError, HubException
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+BATTERY_IDS = ("battery_a", "battery_b")
+
+
+async def no_sleep(*_args):
+    """Return at once, nothing inspects the calls so a mock is not needed."""
+
+
+@pytest.fixture(name="mock_hass", scope="module")
+def mock_hass_fixture():
+    """Stub Home Assistant, the coordinator only stores it."""
+    return SimpleNamespace(data={}, bus=MagicMock(), config_entries=MagicMock())
+
+
+@pytest.fixture(name="mock_hub", scope="module")
+def mock_hub_fixture():
+    """Mock a hub with two batteries."""
+    # AsyncMock makes every hub method awaitable without wiring them one by one
+    hub = AsyncMock()
+    hub.batteries = {battery_id: MagicMock() for battery_id in BATTERY_IDS}
+    hub._clients = dict.fromkeys(BATTERY_IDS)
+    hub.read_data.return_value = {}
+    return hub
+
+
+@pytest.fixture(name="mock_entry", scope="module")
+def mock_entry_fixture():
+    """Mock a config entry."""
+    entry = MagicMock()
+    # Read-only as the entry is shared by every test in the module
+    entry.data = MappingProxyType({CONF_DEVICE_ID: "test-device-id"})
+    return entry
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_hub(mock_hub):
+    """Reset the state tests put on the shared hub."""
+    mock_hub.read_data.reset_mock(return_value=True, side_effect=True)
+    mock_hub.read_data.return_value = {}
+    mock_hub.write_registers.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(name="coordinator")
+def coordinator_fixture(mock_hass, mock_hub, mock_entry):
+    """Create a coordinator instance."""
+    return SAXBatteryCoordinator(mock_hass, mock_hub, 30, mock_entry)
+
+
+class TestSAXBatteryCoordinatorReadOnly:
+    """Test the SAX Battery coordinator without changing its state."""
+
+    @pytest.fixture(name="coordinator", scope="class")
+    def shared_coordinator_fixture(self, mock_hass, mock_hub, mock_entry):
+        """Create one coordinator shared by the whole class."""
+        return SAXBatteryCoordinator(mock_hass, mock_hub, 30, mock_entry)
+
+    def test_coordinator_initialization(self, coordinator, mock_hub):
+        """Test the coordinator is set up from the hub and entry."""
+        assert coordinator.device_id == "test-device-id"
+        assert coordinator.device_info["identifiers"] == {(DOMAIN, "test-device-id")}
+        assert coordinator.batteries == mock_hub.batteries
+        assert coordinator.master_battery is mock_hub.batteries["battery_a"]
+        assert coordinator.soc_keys == ("battery_a_soc", "battery_b_soc")
+        assert coordinator.power_keys == ("battery_a_power", "battery_b_power")
+        assert coordinator.data_version == 0
+        assert coordinator.always_update is False
+
+        # Every battery shares the same register layout
+        for registers in coordinator.modbus_registers.values():
+            assert registers is BATTERY_REGISTERS
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            pytest.param(
+                {
+                    "battery_a_soc": 50,
+                    "battery_b_soc": 60,
+                    "battery_a_power": 100,
+                    "battery_b_power": -50.5,
+                },
+                {"combined_soc": 55.0, "combined_power": 49.5},
+                id="all_batteries",
+            ),
+            pytest.param(
+                {"battery_a_soc": 40, "battery_b_soc": None, "battery_a_power": 200},
+                {"combined_soc": 40.0, "combined_power": 200.0},
+                id="missing_battery",
+            ),
+            pytest.param(
+                {},
+                {"combined_soc": None, "combined_power": 0.0},
+                id="no_data",
+            ),
+            pytest.param(
+                dict.fromkeys(("battery_a_soc", "battery_b_soc", "battery_a_power")),
+                {"combined_soc": None, "combined_power": 0.0},
+                id="none_results",
+            ),
+        ],
+    )
+    def test_calculate_combined_values(self, coordinator, data, expected):
+        """Test combined values from all batteries."""
+        assert coordinator._calculate_combined_values(data) == expected
+
+
+class TestSAXBatteryCoordinatorUpdate:
+    """Test the SAX Battery coordinator data fetching."""
+
+    async def test_async_update_data(self, coordinator, mock_hub):
+        """Test a successful fetch merges combined values."""
+        mock_hub.read_data.return_value = {"battery_a_soc": 80, "battery_a_power": 10}
+
+        data = await coordinator._async_update_data()
+        assert data["battery_a_soc"] == 80
+        assert data["combined_soc"] == 80.0
+        assert data["combined_power"] == 10.0
+        assert coordinator.data_version == 1
+
+    async def test_async_update_data_timeout(self, coordinator, mock_hub):
+        """Test a timed out fetch keeps the last known data."""
+        mock_hub.read_data.side_effect = TimeoutError
+
+        assert await coordinator._async_update_data() == {}
+        assert coordinator.data_version == 0
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            HubException("read failed"),
+            HubConnectionError("not connected"),
+            ValueError("bad register value"),
+        ],
+        ids=lambda error: type(error).__name__,
+    )
+    async def test_async_update_data_error(self, coordinator, mock_hub, error):
+        """Test any fetch error is raised as UpdateFailed."""
+        mock_hub.read_data.side_effect = error
+
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+        assert coordinator.data_version == 0
+
+    @pytest.mark.parametrize(
+        ("write_registers", "expected"),
+        [
+            pytest.param({"return_value": True}, True, id="success"),
+            pytest.param({"return_value": False}, False, id="failure"),
+            pytest.param(
+                {"side_effect": HubException("write failed")}, False, id="error"
+            ),
+        ],
+    )
+    async def test_async_write_modbus_registers(
+        self, coordinator, mock_hub, monkeypatch, write_registers, expected
+    ):
+        """Test register writes report the hub result and swallow errors."""
+        # Skip the delay that keeps writes apart from other integrations
+        monkeypatch.setattr(asyncio, "sleep", no_sleep)
+        mock_hub.write_registers.configure_mock(**write_registers)
+
+        assert (
+            await coordinator.async_write_modbus_registers("battery_a", 45, [2])
+            is expected
+        )
+        mock_hub.write_registers.assert_awaited_once_with("battery_a", 45, [2], 64)
@@ -0,0 +1,100 @@
+"""Tests for the SAX Battery Modbus hub."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.sax_battery.hub import (
+    HubConnectionError,
+    SAXBattery,
+    SAXBatteryHub,
+)
+
+
+async def read_addresses(address, count, slave, battery_id):
+    """Return each register's own address as its value."""
+    return list(range(address, address + count))
+
+
+@pytest.fixture(name="battery")
+def battery_fixture():
+    """Create a battery on a mocked hub."""
+    hub = MagicMock()
+    hub.modbus_read_holding_registers = AsyncMock(side_effect=read_addresses)
+    return SAXBattery(hub, "battery_a", "192.168.1.10", 502)
+
+
+async def test_read_data_coalesces_contiguous_registers(battery):
+    """Test contiguous registers are read in one request per block."""
+    data = await battery.read_data()
+
+    assert data.keys() == battery._register_map.keys()
+    # 32 registers, but only 12 contiguous runs across both slaves
+    assert battery._hub.modbus_read_holding_registers.await_count == 12
+
+    # Each value is sliced from the right offset of its block
+    assert data["soc"] == 46
+    assert data["cycles"] == 40116
+    assert data["smartmeter_voltage_l2"] == 4010.8
+
+
+async def test_read_data_failed_block(battery):
+    """Test a failed block only clears its own registers."""
+
+    async def read_failing_slave(address, count, slave, battery_id):
+        if slave == 64:
+            raise HubConnectionError("Read timeout")
+        return await read_addresses(address, count, slave, battery_id)
+
+    battery._hub.modbus_read_holding_registers.side_effect = read_failing_slave
+    data = await battery.read_data()
+
+    assert data["status"] is None
+    assert data["soc"] is None
+    assert data["cycles"] == 40116
+
+
+async def test_read_data_failed_address_in_block(battery):
+    """Test one unreadable address only clears its own register."""
+
+    async def read_without_power(address, count, slave, battery_id):
+        # The power register (47) is illegal, any read covering it fails
+        if slave == 64 and address <= 47 < address + count:
+            raise HubConnectionError("Illegal data address")
+        return await read_addresses(address, count, slave, battery_id)
+
+    battery._hub.modbus_read_holding_registers.side_effect = read_without_power
+    data = await battery.read_data()
+
+    assert data["power"] is None
+    # Its neighbours in the same block are read one by one instead
+    assert data["status"] == 45
+    assert data["soc"] == 46
+    assert data["smartmeter"] is not None
+    assert data["cycles"] == 40116
+
+
+async def test_hub_reads_batteries_concurrently():
+    """Test every battery is read at the same time, not one after another."""
+    hub = SAXBatteryHub(
+        MagicMock(),
+        [
+            {"battery_id": "battery_a", "host": "192.168.1.10", "port": 502},
+            {"battery_id": "battery_b", "host": "192.168.1.11", "port": 502},
+        ],
+    )
+    hub.connect = AsyncMock(return_value=True)
+    started = {battery_id: asyncio.Event() for battery_id in hub.batteries}
+
+    async def read_battery(battery_id, battery):
+        started[battery_id].set()
+        # Only finishes once the reads of all batteries are in flight
+        await asyncio.gather(*(event.wait() for event in started.values()))
+        return {"soc": 50}
+
+    hub._read_battery_data_safe = read_battery
+    data = await asyncio.wait_for(hub.read_data(), timeout=1)
+
+    assert data["battery_a_soc"] == 50
+    assert data["battery_b_soc"] == 50
@@ -0,0 +1,176 @@
+"""Tests for the SAX Battery pilot."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.sax_battery import pilot as pilot_module
+from custom_components.sax_battery.const import CONF_PRIORITY_DEVICES
+from custom_components.sax_battery.pilot import (
+    POWER_COMMAND_REFRESH_INTERVAL,
+    SAXBatteryPilot,
+)
+
+PRIORITY_DEVICES = ("sensor.heat_pump_power", "sensor.wallbox_power")
+
+
+async def no_sleep(*_args):
+    """Return at once, nothing inspects the calls so a mock is not needed."""
+
+
+def state(value):
+    """Return a minimal entity state."""
+    return SimpleNamespace(state=value)
+
+
+def state_changed(entity_id, new_state):
+    """Return a minimal state changed event."""
+    return SimpleNamespace(data={"entity_id": entity_id, "new_state": new_state})
+
+
+async def run_tick(pilot):
+    """Run one pilot tick and wait for the power commands it sent."""
+    pilot.hass.async_create_task.reset_mock()
+    await pilot._async_update_pilot()
+    for call in pilot.hass.async_create_task.call_args_list:
+        await call.args[0]
+
+
+def advance(pilot, seconds):
+    """Age the last written command as if the given time had passed."""
+    pilot._last_command_time -= seconds
+
+
+@pytest.fixture(name="pilot")
+def pilot_fixture(monkeypatch):
+    """Create a pilot tracking two priority devices."""
+    monkeypatch.setattr(pilot_module, "async_track_state_change_event", MagicMock())
+    hass = MagicMock()
+    entry = MagicMock()
+    entry.data = {CONF_PRIORITY_DEVICES: list(PRIORITY_DEVICES)}
+    sax_data = SimpleNamespace(
+        entry=entry,
+        batteries={"battery_a": MagicMock()},
+        master_battery=MagicMock(),
+        master_battery_id="battery_a",
+        hub=AsyncMock(),
+        data={"combined_soc": 50},
+        device_id="test-device-id",
+    )
+    return SAXBatteryPilot(hass, sax_data)
+
+
+def test_priority_power_bookkeeping(pilot):
+    """Test the priority power total follows device changes."""
+    heat_pump, wallbox = PRIORITY_DEVICES
+    states = {heat_pump: state("100"), wallbox: state("unavailable")}
+    pilot.hass.states.get.side_effect = states.get
+
+    # Seed from the current states, an unavailable device counts as 0W
+    pilot._async_track_priority_devices()
+    assert pilot._priority_power_total == 100
+
+    pilot._async_priority_device_changed(state_changed(wallbox, state("2000")))
+    assert pilot._priority_power_total == 2100
+
+    pilot._async_priority_device_changed(state_changed(heat_pump, state("40")))
+    assert pilot._priority_power_total == 2040
+
+    # Unavailable drops the device's contribution instead of keeping it
+    pilot._async_priority_device_changed(state_changed(wallbox, state("unavailable")))
+    assert pilot._priority_power_total == 40
+
+    # So does removing the entity
+    pilot._async_priority_device_changed(state_changed(heat_pump, None))
+    assert pilot._priority_power_total == 0
+    assert pilot._priority_power == {}
+
+
+@pytest.fixture(name="skip_write_delay")
+def skip_write_delay_fixture(monkeypatch):
+    """Skip the delay that keeps writes apart from coordinator reads."""
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+
+
+@pytest.mark.usefixtures("skip_write_delay")
+async def test_send_power_command_coalesces_burst(pilot):
+    """Test commands sent during a write collapse to the latest one."""
+    writes = []
+    write_started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def write(battery_id, address, values, slave):
+        writes.append(values)
+        write_started.set()
+        await release.wait()
+        return True
+
+    pilot._hub.modbus_write_registers.side_effect = write
+    first = asyncio.create_task(pilot.send_power_command(100, 1.0))
+    await write_started.wait()
+
+    # Both arrive while the first write is in flight
+    await pilot.send_power_command(200, 1.0)
+    await pilot.send_power_command(300, 1.0)
+    release.set()
+    await first
+
+    assert writes == [[100, 10], [300, 10]]
+    assert pilot._last_command == (300, 10)
+
+
+@pytest.mark.usefixtures("skip_write_delay")
+async def test_failed_power_command_is_retried(pilot):
+    """Test a failed write is sent again on the next tick."""
+    pilot.manual_control_enabled = True
+    pilot.calculated_power = 500
+    pilot._hub.modbus_write_registers.side_effect = [False, True]
+
+    await run_tick(pilot)
+    assert pilot._last_command is None
+
+    await run_tick(pilot)
+    assert pilot._last_command == (500, 10)
+
+    # Written successfully, so the next tick skips it
+    await run_tick(pilot)
+    assert pilot._hub.modbus_write_registers.await_count == 2
+
+
+@pytest.mark.usefixtures("skip_write_delay")
+async def test_unchanged_power_command_is_refreshed(pilot):
+    """Test an unchanged command is skipped until the refresh interval."""
+    pilot.manual_control_enabled = True
+    pilot.calculated_power = 500
+    writes = pilot._hub.modbus_write_registers
+
+    # Ticks one default interval apart, only every other one writes
+    await run_tick(pilot)
+    advance(pilot, pilot.update_interval)
+    await run_tick(pilot)
+    assert writes.await_count == 1
+
+    advance(pilot, pilot.update_interval)
+    await run_tick(pilot)
+    assert writes.await_count == 2
+
+    # A new value is sent at once
+    pilot.calculated_power = 600
+    await run_tick(pilot)
+    assert writes.await_count == 3
+    assert pilot._last_command == (600, 10)
+
+
+@pytest.mark.usefixtures("skip_write_delay")
+async def test_long_ticks_always_write(pilot):
+    """Test ticks longer than the refresh interval resend every time."""
+    pilot.manual_control_enabled = True
+    pilot.calculated_power = 500
+    pilot.update_interval = POWER_COMMAND_REFRESH_INTERVAL + 60
+
+    await run_tick(pilot)
+    advance(pilot, pilot.update_interval)
+    await run_tick(pilot)
+    assert pilot._hub.modbus_write_registers.await_count == 2